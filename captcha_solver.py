@@ -5,6 +5,8 @@ Supports Cloudflare Turnstile and reCAPTCHA v2/v3
 import time
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class CaptchaSolver:
@@ -21,6 +23,12 @@ class CaptchaSolver:
         self.api_key = api_key
         self.api_url = "http://2captcha.com"
         self.enabled = api_key is not None
+        # One pooled session for submitting and polling, so each request skips the TCP/TLS handshake;
+        # only idempotent requests (the polls) are retried, never a paid submit
+        self.session = requests.Session()
+        adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         if self.enabled:
             print(f"✓ CAPTCHA solver enabled (2Captcha API)")
@@ -58,7 +66,7 @@ class CaptchaSolver:
                 'json': 1
             }
             
-            response = requests.post(submit_url, data=submit_data, timeout=30)
+            response = self.session.post(submit_url, data=submit_data, timeout=30)
             result = response.json()
             
             if result['status'] != 1:
@@ -83,7 +91,7 @@ class CaptchaSolver:
                     'json': 1
                 }
                 
-                response = requests.get(get_url, params=get_params, timeout=30)
+                response = self.session.get(get_url, params=get_params, timeout=30)
                 result = response.json()
                 
                 if result['status'] == 1:
@@ -133,7 +141,7 @@ class CaptchaSolver:
                 'json': 1
             }
             
-            response = requests.post(submit_url, data=submit_data, timeout=30)
+            response = self.session.post(submit_url, data=submit_data, timeout=30)
             result = response.json()
             
             if result['status'] != 1:
@@ -158,7 +166,7 @@ class CaptchaSolver:
                     'json': 1
                 }
                 
-                response = requests.get(get_url, params=get_params, timeout=30)
+                response = self.session.get(get_url, params=get_params, timeout=30)
                 result = response.json()
                 
                 if result['status'] == 1:
@@ -194,7 +202,7 @@ class CaptchaSolver:
                 'json': 1
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             result = response.json()
             
             if result['status'] == 1:
@@ -203,3 +211,7 @@ class CaptchaSolver:
         except:
             return None
 
+    
+    def close(self):
+        """Close the pooled HTTP session"""
+        self.session.close()
@@ -1,6 +1,8 @@
 import time
 import re
+import sys
 import gspread
+from gspread.utils import absolute_range_name
 from google.oauth2.service_account import Credentials
 
 # Always import Selenium components (needed for fallback even when undetected-chromedriver is available)
@@ -19,11 +21,49 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
+import asyncio
 import json
+import logging
 import os
+import queue
 import random
+import socket
+import sqlite3
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
+# Try to import httpx + selectolax (optional, for reading plain pages without a browser)
+try:
+    import httpx
+    from selectolax.lexbor import LexborHTMLParser
+    FAST_HTTP_AVAILABLE = True
+except ImportError:
+    FAST_HTTP_AVAILABLE = False
+
+# Try to import hyperscan (optional, Linux/macOS only) for a fast digit prefilter before the phone regex
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Try to import orjson (optional) for faster JSON-LD parsing
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Try to import diskcache (optional, to remember slow lookups between runs)
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
 # Import CAPTCHA solver (optional)
 try:
     from captcha_solver import CaptchaSolver
@@ -33,10 +73,514 @@ except ImportError:
     CaptchaSolver = None
 from urllib.parse import urljoin, urlparse
 
+# Per-page and per-business progress goes through this logger so it can be turned down
+# (e.g. to WARNING in the GUI) on long runs; warnings and errors are still printed
+logger = logging.getLogger(__name__)
+
+# On-disk cache for Google/HomeAdvisor lookups, kept for a week
+CACHE_DIR = '.scraper_cache'
+CACHE_EXPIRE = 7 * 24 * 60 * 60
+
+# HomeAdvisor shows this many businesses per listing page
+LISTINGS_PER_PAGE = 10
+
+# Business fields written to the sheet, in column order, and the sheet's header row
+SHEET_COLUMNS = ('business_name', 'star_rating', 'num_reviews', 'address', 'website', 'phone', 'email')
+SHEET_HEADERS = ['business name', 'star rating', '# of reviews', 'address', 'website', 'Phone Number', 'Email']
+
+# Fields filled in by enrichment, cached per profile URL
+_ENRICHED_FIELDS = ('address', 'website', 'phone', 'email')
+
+# Local SQLite copy of every scraped business, written as soon as it is scraped so a
+# crash or a Sheets outage never loses data
+PROGRESS_DB = 'scraped_businesses.db'
+
+# Businesses are buffered and written to the sheet in one call once this many are waiting
+SHEET_FLUSH_THRESHOLD = 500
+
+# Sheet write retries: exponential backoff from SHEET_RETRY_BASE seconds, capped, with jitter
+SHEET_MAX_RETRIES = 6
+SHEET_RETRY_BASE = 1
+SHEET_RETRY_MAX = 60
+
+# HomeAdvisor requests from all workers share one adaptive rate limit: it starts at
+# this many per period (seconds), halves on 429/503 or challenges and creeps back up to the max
+HOMEADVISOR_RATE_CALLS = 8
+HOMEADVISOR_RATE_MAX_CALLS = 20
+HOMEADVISOR_RATE_PERIOD = 5
+
+# Listing pages are fetched over HTTP this many at a time, ahead of the browser
+LISTING_CONCURRENCY = 10
+LISTING_PREFETCH_WINDOW = 10
+
+# Markers of a Cloudflare challenge page (the real page needs a browser to get through)
+_CHALLENGE_MARKERS = ('challenges.cloudflare.com', 'cf-turnstile', '<title>Just a moment...</title>')
+_CHALLENGE_MARKER_BYTES = tuple(marker.encode() for marker in _CHALLENGE_MARKERS)
+
+# Case-insensitive page checks, run on the raw page source instead of a lowercased copy of it
+_CAPTCHA_RE = re.compile(r'captcha|challenge|verify you are human|cloudflare|access denied', re.I)
+_CLOUDFLARE_RE = re.compile(r'cloudflare', re.I)
+_CLOUDFLARE_PAGE_RE = re.compile(
+    r'just a moment|cloudflare|verify you are human|checking your browser|cf-turnstile|challenges\.cloudflare\.com', re.I)
+_CHALLENGE_PENDING_RE = re.compile(r'just a moment|verify you are human|checking your browser', re.I)
+
+# "Showing 1-10 of 1,043"-style result counts and page numbers in pagination links
+_TOTAL_ITEMS_RE = re.compile(r'(?:Showing\s+)?\d+-\d+\s+of\s+(\d+)', re.I)
+_PAGE_PARAM_RE = re.compile(r'page=(\d+)')
+
+# CAPTCHA site keys in an iframe URL or a data-sitekey attribute
+_SITEKEY_PARAM_RE = re.compile(r'sitekey=([^&]+)')
+_SITEKEY_ATTR_RE = re.compile(r'data-sitekey=["\']([^"\']+)["\']')
+
+# JSON-LD script blocks in a page's source
+_JSON_LD_RE = re.compile(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.S | re.I)
+
+# Email addresses in a page's text
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Links that are never a business's own website, and placeholder email domains
+_WEBSITE_SKIP_RE = re.compile(
+    r'homeadvisor\.com|facebook\.com|twitter\.com|linkedin\.com|instagram\.com|youtube\.com|pinterest\.com', re.I)
+_EMAIL_SKIP_RE = re.compile(r'example\.com|test\.com|placeholder', re.I)
+
+# Resources the browser doesn't need to fetch. Stylesheets are still loaded because
+# Cloudflare's challenge widget needs them.
+_BLOCKED_URL_PATTERNS = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*facebook.net*', '*hotjar.com*', '*analytics*',
+)
+
+# Scripts that read several DOM values in one WebDriver round-trip instead of one call per value
+_PROFILE_LINKS_SCRIPT = """
+return Array.from(document.querySelectorAll('a[href*="rated"], a[href*="/pro/"]')).slice(0, 5).map(function (a) {
+    var parent = a.parentElement && a.parentElement.closest('[class*="result"], [class*="listing"], [class*="card"]');
+    return {href: a.href, parentText: parent ? parent.innerText : null};
+});
+"""
+_BODY_TEXT_SCRIPT = "return document.body ? document.body.innerText : '';"
+_PHONE_BUTTON_SCRIPT = """
+var button = document.querySelector(
+    'button[data-testid="angi_button"][class*="BusinessProfileHero_phoneNumber"], button[class*="BusinessProfileHero_phoneNumber"]');
+return button ? {name: button.getAttribute('name'), text: button.innerText} : null;
+"""
+
+_HOMEADVISOR_BASE = 'https://www.homeadvisor.com/'
+
+# Bound once; the random page-load waits are computed as a + (b - a) * _rand()
+_rand = random.random
+
+# Selectors for the profile page's "Phone number" button, tried in order
+_PHONE_BUTTON_SELECTORS = (
+    (By.ID, "view-phone-number"),
+    (By.CSS_SELECTOR, "button#view-phone-number"),
+    (By.CSS_SELECTOR, "[id='view-phone-number']"),
+    (By.XPATH, "//button[@id='view-phone-number']"),
+    (By.XPATH, "//button[contains(@aria-label, 'phone') or contains(@aria-label, 'Phone')]"),
+    (By.XPATH, "//button[contains(text(), 'Phone') or contains(text(), 'phone')]"),
+    (By.CSS_SELECTOR, "button[data-testid*='phone']"),
+    (By.CSS_SELECTOR, "a[href*='phone']"),
+)
+
+def _absolute_url(url):
+    """Resolve a HomeAdvisor link (absolute, root-relative or bare path) to a full URL"""
+    return url if url.startswith('http') else urljoin(_HOMEADVISOR_BASE, url)
+
+
+def _load_json_ld(text):
+    """Parse a JSON-LD script body, returning None if it is empty or not JSON"""
+    text = text.strip()
+    # Only objects and arrays are useful; skip the parser for anything else
+    if not text or text[0] not in '{[':
+        return None
+    try:
+        return _json_loads(text)
+    except ValueError:
+        return None
+
+
+def _find_business_url_in_json(obj, target_name):
+    """Recursively search JSON-LD for the profile URL of the business named target_name"""
+    if isinstance(obj, dict):
+        # Check if this is a business object with matching name
+        obj_type = str(obj.get('@type', ''))
+        if 'HomeAndConstructionBusiness' in obj_type or 'LocalBusiness' in obj_type:
+            if 'name' in obj and target_name.lower() in obj['name'].lower():
+                url = obj.get('url')
+                if url and ('rated' in url or '/pro/' in url):
+                    return url
+        # Check itemListElement for businesses
+        for item in obj.get('itemListElement', ()):
+            if 'item' in item:
+                result = _find_business_url_in_json(item['item'], target_name)
+                if result:
+                    return result
+        # Recursively search all values
+        for value in obj.values():
+            result = _find_business_url_in_json(value, target_name)
+            if result:
+                return result
+    elif isinstance(obj, list):
+        for item in obj:
+            result = _find_business_url_in_json(item, target_name)
+            if result:
+                return result
+    return None
+
+
+# Selectors for the parts of a listing page's business cards, tried in order
+_CARD_SELECTOR = 'article.ProList_businessProCard__qvaeT'
+_CARD_NAME_SELECTORS = (
+    'h3[data-testid="business-name-desktop"]',
+    'h3[data-testid="business-name-mobile"]',
+    'h3.BusinessProfileCard_header__srI3D',
+)
+_CARD_PROFILE_LINK_SELECTORS = ('a[data-testid="profile-link"]', 'a[href*="rated"], a[href*="/pro/"]')
+_CARD_RATING_SELECTORS = (
+    'div[data-testid="star-rating-desktop"] span.RatingsLockup_ratingNumber__2CoLI',
+    'div[data-testid="star-rating-mobile"] span.RatingsLockup_ratingNumber__2CoLI',
+    'span.RatingsLockup_ratingNumber__2CoLI',
+)
+_CARD_REVIEWS_SELECTORS = (
+    'div[data-testid="star-rating-desktop"] span.RatingsLockup_reviewCount__u0DTP div',
+    'div[data-testid="star-rating-mobile"] span.RatingsLockup_reviewCount__u0DTP div',
+    'span.RatingsLockup_reviewCount__u0DTP div',
+)
+_ARIA_NAME_RE = re.compile(r'^([^(]+)')
+_ARIA_RATING_RE = re.compile(r'Rating:\s*([\d.]+)')
+
+
+def _first_text(node, selectors):
+    """Return the stripped text of the first selector that matches with non-empty text"""
+    for selector in selectors:
+        match = node.css_first(selector)
+        if match is not None:
+            text = match.text(strip=True)
+            if text:
+                return text
+    return ''
+
+
+def _parse_card_node(card):
+    """Extract the same fields as extract_business_info_from_card from a parsed HTML card"""
+    data = {
+        'business_name': _first_text(card, _CARD_NAME_SELECTORS),
+        'star_rating': '',
+        'num_reviews': '',
+        'address': '',
+        'website': '',
+        'phone': '',
+        'email': '',
+        'profile_url': ''
+    }
+    
+    for selector in _CARD_PROFILE_LINK_SELECTORS:
+        link = card.css_first(selector)
+        href = link.attributes.get('href') if link is not None else None
+        if href:
+            data['profile_url'] = _absolute_url(href)
+            # Last resort for the name: aria-label like "AK Aire, LLC profile (opens in new tab)"
+            if not data['business_name']:
+                match = _ARIA_NAME_RE.search(link.attributes.get('aria-label') or '')
+                if match:
+                    data['business_name'] = match.group(1).strip()
+            break
+    
+    data['star_rating'] = _first_text(card, _CARD_RATING_SELECTORS)
+    if not data['star_rating']:
+        rating_container = card.css_first('div[aria-label*="Rating:"]')
+        if rating_container is not None:
+            match = _ARIA_RATING_RE.search(rating_container.attributes.get('aria-label') or '')
+            if match:
+                data['star_rating'] = match.group(1)
+    
+    if 'no reviews yet' in card.text().lower():
+        data['num_reviews'] = '0'
+    else:
+        reviews_text = _first_text(card, _CARD_REVIEWS_SELECTORS).strip('()')
+        if reviews_text.isdigit():
+            data['num_reviews'] = reviews_text
+    
+    return data
+
+
+def _page_html(response):
+    """HTML of a listing or profile page response, or None if it was refused or is a Cloudflare challenge.
+    
+    HomeAdvisor serves UTF-8, so the raw bytes go straight to Lexbor without being
+    decoded to str and encoded back.
+    """
+    html = response.content
+    if response.status_code != 200 or any(marker in html for marker in _CHALLENGE_MARKER_BYTES):
+        return None
+    return html
+
+
+def _iter_listing_html(html):
+    """Yield the business cards of a listing page's HTML as they are parsed, without a browser"""
+    seen_urls = set()
+    seen_names = set()
+    for card in LexborHTMLParser(html).css(_CARD_SELECTOR):
+        business_data = _parse_card_node(card)
+        business_name = business_data['business_name']
+        if not business_name:
+            continue
+        # Use business name as unique identifier if no profile URL
+        unique_id = business_data['profile_url'] or business_name
+        if unique_id not in seen_urls and business_name not in seen_names:
+            seen_urls.add(unique_id)
+            seen_names.add(business_name)
+            yield business_data
+
+
+def _parse_listing_html(html):
+    """Parse the business cards out of a listing page's HTML, without a browser"""
+    return list(_iter_listing_html(html))
+
+
+# Contact details on a profile page, most specific selector first
+_PROFILE_ADDRESS_SELECTORS = (
+    'div[data-testid="contact-information-component"] h3.SubComponents_subHeader__JUXIF',
+    'h3.SubComponents_subHeader__JUXIF',
+)
+_PROFILE_WEBSITE_SELECTORS = (
+    'div[data-testid="contact-information-component"] a.SubComponents_link__Gpwoa',
+    'a.SubComponents_link__Gpwoa',
+)
+_PROFILE_PHONE_BUTTON_SELECTOR = 'button[class*="BusinessProfileHero_phoneNumber"]'
+
+
+def _parse_profile_html(html):
+    """Parse the address, website and phone out of a profile page's HTML.
+    
+    Pure (no scraper state), so it can run in a worker thread. The phone is only
+    read from the revealed phone button; the rest of the page is not searched, since
+    it carries site-wide numbers, so a hidden phone is left for the browser.
+    """
+    data = {
+        'website': '',
+        'phone': '',
+        'address': '',
+        'star_rating': '',
+        'num_reviews': ''
+    }
+    tree = LexborHTMLParser(html)
+    
+    for selector in _PROFILE_ADDRESS_SELECTORS:
+        heading = tree.css_first(selector)
+        if heading is None:
+            continue
+        address_text = heading.text(separator=' ', strip=True)
+        if len(address_text) > 10:
+            data['address'] = address_text
+        break
+    
+    for selector in _PROFILE_WEBSITE_SELECTORS:
+        link = tree.css_first(selector)
+        if link is None:
+            continue
+        href = link.attributes.get('href') or ''
+        if href.startswith('http') and not _WEBSITE_SKIP_RE.search(href):
+            data['website'] = href
+        break
+    
+    phone_button = tree.css_first(_PROFILE_PHONE_BUTTON_SELECTOR)
+    if phone_button is not None:
+        data['phone'] = (_find_phone(phone_button.attributes.get('name') or '')
+                         or _find_phone(phone_button.text()) or '')
+    
+    return data
+
+
+def _prewarm_dns(host):
+    """Resolve host once so the OS resolver cache is warm for the first real connection"""
+    try:
+        socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+    except OSError:
+        pass
+
+
+def _is_header_row(row):
+    """Whether a sheet row looks like the header row"""
+    first_row = [str(v).lower().strip() for v in row]
+    return 'business name' in first_row or 'businessname' in ''.join(first_row)
+
+
+def _api_status(error):
+    """HTTP status of a gspread APIError, or None for other errors"""
+    response = getattr(error, 'response', None)
+    if isinstance(error, gspread.exceptions.APIError) and response is not None:
+        return response.status_code
+    return None
+
+
+def _is_retryable_sheet_error(error):
+    """Rate limits, server errors and network errors are worth retrying; other API errors are not"""
+    status = _api_status(error)
+    return status is None or status == 429 or status >= 500
+
+
+def _sheet_retry_delay(attempt, error):
+    """Seconds to wait before retrying a sheet write.
+    
+    A 429 with a Retry-After header is honored; otherwise the delay doubles per
+    attempt and gets random jitter so parallel writers don't retry in lockstep.
+    """
+    if _api_status(error) == 429:
+        try:
+            return min(SHEET_RETRY_MAX, float(error.response.headers['Retry-After']))
+        except (KeyError, TypeError, ValueError):
+            pass
+    return min(SHEET_RETRY_MAX, SHEET_RETRY_BASE * 2 ** attempt) + SHEET_RETRY_BASE * _rand()
+
+
+# US phone number like (123) 456-7890, 123-456-7890 or 123.456.7890
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
+# Translation table that deletes everything but ASCII digits from a phone match
+# (Latin-1 plus the Unicode spaces that \s can match between digit groups)
+_NON_DIGITS = str.maketrans('', '', ''.join(
+    chr(c) for c in range(0x3001) if not 48 <= c <= 57 and (c < 256 or chr(c).isspace())))
+
+# Every phone number contains a run of three digits, so hyperscan only has to find the first
+# such run; the regex then starts just before it instead of walking the whole text
+_DIGIT_RUN_DB = None
+if HYPERSCAN_AVAILABLE:
+    _DIGIT_RUN_DB = hyperscan.Database()
+    _DIGIT_RUN_DB.compile(expressions=[rb'\d{3}'], ids=[0], flags=[0])
+
+# Hyperscan scratch space can't be shared between threads, so each enrichment thread gets its own
+_scan_local = threading.local()
+
+
+def _phone_scan_start(text):
+    """Return the offset to start the phone regex from, or -1 if text can't contain a phone number"""
+    if _DIGIT_RUN_DB is None:
+        return 0
+    ends = []
+    
+    def on_match(match_id, start, end, flags, context):
+        ends.append(end)
+        return True  # Stop at the first run
+    
+    scratch = getattr(_scan_local, 'scratch', None)
+    try:
+        if scratch is None:
+            scratch = _scan_local.scratch = hyperscan.Scratch(_DIGIT_RUN_DB)
+        # 'replace' keeps one byte per character, so offsets line up with the str
+        _DIGIT_RUN_DB.scan(text.encode('ascii', 'replace'), match_event_handler=on_match, scratch=scratch)
+    except hyperscan.ScanTerminated:
+        pass
+    except hyperscan.error:
+        return 0  # Let the regex scan the whole text
+    if not ends:
+        return -1
+    # The first match starts at most one character ("(") before its first three digits
+    return max(0, ends[0] - 4)
+
+
+def _find_phone(text, skip_invalid_area_codes=False):
+    """Return the first phone number in text formatted as (123) 456-7890, or None.
+    
+    With skip_invalid_area_codes, numbers starting with 0 or 1 (usually dates or IDs) are skipped.
+    """
+    start = _phone_scan_start(text)
+    if start < 0:
+        return None
+    for match in _PHONE_RE.finditer(text, start):
+        phone = match.group(0).translate(_NON_DIGITS)
+        if len(phone) == 10 or (len(phone) == 11 and phone[0] == '1'):
+            if len(phone) == 11:
+                phone = phone[1:]
+            if skip_invalid_area_codes and phone[0] not in '23456789':
+                continue
+            return f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
+        if not skip_invalid_area_codes:
+            return None
+    return None
+
+
+class _RateLimiter:
+    """Thread-safe token bucket whose rate adapts to how the site responds (AIMD).
+    
+    Starts at `calls` requests per `period` seconds. Every throttling response
+    halves the rate; every `increase_after` successful responses add one request
+    per period back, up to `max_calls`.
+    """
+    
+    def __init__(self, calls, period, max_calls=None, min_calls=1, increase_after=10):
+        self.period = period
+        self.rate = calls / period
+        self.min_rate = min_calls / period
+        self.max_rate = (max_calls or calls) / period
+        self.increase_after = increase_after
+        self.successes = 0
+        self.tokens = float(calls)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _take(self):
+        """Take a token and return 0, or return how long to wait for one"""
+        with self.lock:
+            now = time.monotonic()
+            # Allow bursts of up to one period's worth of requests at the current rate
+            capacity = max(1.0, self.rate * self.period)
+            self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Like acquire(), but waits without blocking the event loop"""
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+    
+    def backoff(self):
+        """The site pushed back: halve the rate and drop any saved-up burst"""
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            self.successes = 0
+    
+    def success(self):
+        """A request went through: probe a little faster every few successes"""
+        with self.lock:
+            self.successes += 1
+            if self.successes >= self.increase_after:
+                self.successes = 0
+                self.rate = min(self.max_rate, self.rate + 1 / self.period)
+    
+    def observe(self, status_code, challenged=False):
+        """Adjust the rate from an HTTP status code (403 is how Cloudflare blocks plain HTTP)"""
+        if challenged or status_code in (403, 429, 503):
+            self.backoff()
+        elif status_code < 400:
+            self.success()
+
+
 class HomeAdvisorScraper:
-    def __init__(self, base_url, google_sheet_id, credentials_file=None, headless=True, captcha_api_key=None):
+    def __init__(self, base_url, google_sheet_id, credentials_file=None, headless=True, captcha_api_key=None, enrich_workers=1,
+                 fast_mode=False):
         # Store the base URL (can be any HomeAdvisor listing URL)
         self.base_url = base_url.split('?')[0]  # Remove any existing query parameters
+        # Look up HomeAdvisor's address in the background while the rest of the setup runs
+        threading.Thread(target=_prewarm_dns, args=(urlparse(self.base_url).hostname or 'www.homeadvisor.com',),
+                         daemon=True).start()
+        
         self.headless = headless
         self.using_undetected = UC_AVAILABLE  # Track if we're using undetected-chromedriver
         
@@ -70,14 +614,95 @@ class HomeAdvisorScraper:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         ]
         
-        # No need for requests session - using Selenium only
+        self.user_agents = user_agents
         self.user_agent = random.choice(user_agents)
         
+        # Driver pool: one browser per enrichment worker, borrowed per thread.
+        # The first browser doubles as the main driver for listing pages.
+        self.enrich_workers = max(1, int(enrich_workers))
+        self._local = threading.local()
+        self._driver_pool = queue.Queue()
+        self._drivers = []
+        # Politeness is enforced across all workers, adapting to how HomeAdvisor responds,
+        # instead of sleeping a fixed random time after every business and page
+        self._limiter = _RateLimiter(HOMEADVISOR_RATE_CALLS, HOMEADVISOR_RATE_PERIOD, HOMEADVISOR_RATE_MAX_CALLS)
+        # In fast mode the browsers are only launched once a page actually needs one,
+        # so runs served entirely over HTTP never pay for starting Chrome
+        self._driver = None
+        self._drivers_lock = threading.Lock()
+        if not fast_mode:
+            self._start_browsers()
+        
+        # Async HTTP client shared by a running pipeline, and the event loop it is tied to
+        self._shared_async_client = None
+        self._shared_async_loop = None
+        
+        # Persistent HTTP client for pages that don't need JavaScript (business websites)
+        self._http = None
+        if FAST_HTTP_AVAILABLE:
+            self._http = httpx.Client(
+                http2=True,
+                timeout=10,
+                follow_redirects=True,
+                headers={'User-Agent': self.user_agent},
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+        
+        # Cache successful lookups so reruns over the same businesses skip the network
+        self._query_cache = Cache(CACHE_DIR) if DISKCACHE_AVAILABLE else None
+        
+        # Businesses waiting to be written to the sheet
+        self._pending_businesses = []
+        
+        # Local copy of everything scraped, in case the sheet can't be written
+        self._progress_db = sqlite3.connect(PROGRESS_DB, check_same_thread=False)
+        self._progress_lock = threading.Lock()
+        with self._progress_lock, self._progress_db:
+            self._progress_db.execute(
+                f"CREATE TABLE IF NOT EXISTS businesses ({', '.join(SHEET_COLUMNS)}, profile_url, scraped_at)")
+        
+        # Setup Google Sheets
+        self.sheet_id = google_sheet_id
+        if not (credentials_file and os.path.exists(credentials_file)):
+            # Try to use default credentials
+            credentials_file = 'homeadvisorelizabethscraping-613984138d99.json'
+        scope = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
+        # Read the key file with the fast JSON parser (orjson when installed)
+        with open(credentials_file, 'rb') as f:
+            creds = Credentials.from_service_account_info(_json_loads(f.read()), scopes=scope)
+        self.gc = gspread.authorize(creds)
+        
+        self.sheet = self.gc.open_by_key(self.sheet_id).sheet1
+        
+        # Sheet writes happen on a background thread so a slow or rate-limited
+        # Sheets API never holds up scraping
+        self._write_queue = queue.Queue()
+        self._unwritten_businesses = []
+        self._sheet_writer = threading.Thread(target=self._sheet_writer_loop, daemon=True)
+        self._sheet_writer.start()
+        
+    def _start_browsers(self):
+        """Launch the browser pool, unless it is already running"""
+        with self._drivers_lock:
+            if self._driver is not None:
+                return
+            self._driver = self._create_driver()
+            self._drivers.append(self._driver)
+            self._driver_pool.put(self._driver)
+            if self.enrich_workers > 1:
+                print(f"Starting {self.enrich_workers - 1} additional browser(s) for parallel enrichment...")
+                for _ in range(self.enrich_workers - 1):
+                    driver = self._create_driver()
+                    self._drivers.append(driver)
+                    self._driver_pool.put(driver)
+    
+    def _create_driver(self):
+        """Launch a new Chrome WebDriver with the stealth settings"""
         # Setup Selenium with Chrome browser (Chrome must be installed)
         # ChromeDriver will be automatically downloaded by webdriver-manager
         chrome_options = Options()
         
-        # if headless:
+        # if self.headless:
         #     chrome_options.add_argument('--headless=new')  # New headless mode is less detectable
         
         chrome_options.add_argument('--no-sandbox')
@@ -87,7 +712,9 @@ class HomeAdvisorScraper:
         chrome_options.add_argument('--disable-extensions')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--start-maximized')
-        chrome_options.add_argument(f'--user-agent={random.choice(user_agents)}')
+        chrome_options.add_argument(f'--user-agent={random.choice(self.user_agents)}')
+        # Return from driver.get at DOMContentLoaded; the scraper waits for the elements it needs anyway
+        chrome_options.page_load_strategy = 'eager'
         
         # Remove automation indicators
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
@@ -111,16 +738,17 @@ class HomeAdvisorScraper:
                 chrome_options_uc = uc.ChromeOptions()
                 # Note: Cloudflare bypass works better in non-headless mode
                 # If you encounter issues, set headless=False
-                if headless:
+                if self.headless:
                     chrome_options_uc.add_argument('--headless=new')
                 chrome_options_uc.add_argument('--no-sandbox')
                 chrome_options_uc.add_argument('--disable-dev-shm-usage')
                 chrome_options_uc.add_argument('--window-size=1920,1080')
-                chrome_options_uc.add_argument(f'--user-agent={random.choice(user_agents)}')
+                chrome_options_uc.add_argument(f'--user-agent={random.choice(self.user_agents)}')
+                chrome_options_uc.page_load_strategy = 'eager'
                 
                 # Initialize undetected Chrome (automatically handles Cloudflare Turnstile)
                 # undetected-chromedriver automatically patches ChromeDriver to bypass Cloudflare
-                self.driver = uc.Chrome(options=chrome_options_uc, version_main=None)
+                driver = uc.Chrome(options=chrome_options_uc, version_main=None)
                 print("Undetected ChromeDriver initialized (Cloudflare bypass enabled)")
             else:
                 # Fall back to regular Selenium
@@ -235,7 +863,7 @@ class HomeAdvisorScraper:
                 
                 print(f"Using ChromeDriver at: {driver_path}")
                 
-                self.driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+                driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
                 print("✓ Chrome browser initialized successfully")
         except OSError as e:
             if "WinError 193" in str(e) or "not a valid Win32 application" in str(e):
@@ -261,7 +889,7 @@ class HomeAdvisorScraper:
             raise
         
         # Execute script to remove webdriver property (anti-detection)
-        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
             'source': '''
                 Object.defineProperty(navigator, 'webdriver', {
                     get: () => undefined
@@ -269,20 +897,39 @@ class HomeAdvisorScraper:
             '''
         })
         
-        # Setup Google Sheets
-        self.sheet_id = google_sheet_id
-        if credentials_file and os.path.exists(credentials_file):
-            scope = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-            creds = Credentials.from_service_account_file(credentials_file, scopes=scope)
-            self.gc = gspread.authorize(creds)
-        else:
-            # Try to use default credentials
-            scope = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-            creds = Credentials.from_service_account_file('homeadvisorelizabethscraping-613984138d99.json', scopes=scope)
-            self.gc = gspread.authorize(creds)
-        
-        self.sheet = self.gc.open_by_key(self.sheet_id).sheet1
+        # Don't download images, fonts, media or trackers - none of them are scraped
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(_BLOCKED_URL_PATTERNS)})
+        except Exception as e:
+            print(f"⚠️  Could not enable request blocking: {e}")
         
+        return driver
+    
+    @property
+    def driver(self):
+        """The driver borrowed by the current thread, or the main driver"""
+        driver = getattr(self._local, 'driver', None) or self._driver
+        if driver is None:
+            self._start_browsers()
+            driver = self._driver
+        return driver
+    
+    @contextmanager
+    def _borrow_driver(self):
+        """Check a driver out of the pool for the current thread (re-entrant)"""
+        if getattr(self._local, 'driver', None) is not None:
+            yield self._local.driver
+            return
+        self._start_browsers()
+        driver = self._driver_pool.get()
+        self._local.driver = driver
+        try:
+            yield driver
+        finally:
+            self._local.driver = None
+            self._driver_pool.put(driver)
+    
     def get_page_url(self, page_num):
         """Generate URL for a specific page"""
         if page_num == 1:
@@ -296,7 +943,7 @@ class HomeAdvisorScraper:
         try:
             print("Detecting total number of pages...")
             self.driver.get(self.base_url)
-            time.sleep(random.uniform(3, 5))
+            time.sleep(3.0 + 2.0 * _rand())
             
             # Wait for Cloudflare challenge if present
             self.wait_for_cloudflare_challenge()
@@ -323,7 +970,7 @@ class HomeAdvisorScraper:
                 for elem in pagination_elements:
                     text = elem.text.strip()
                     # Look for pattern like "Showing 1-10 of 1050" or "1-10 of 1050"
-                    match = re.search(r'(?:Showing\s+)?\d+-\d+\s+of\s+(\d+)', text, re.IGNORECASE)
+                    match = _TOTAL_ITEMS_RE.search(text)
                     if match:
                         total_items = int(match.group(1))
                         # HomeAdvisor typically shows 10 items per page
@@ -338,7 +985,7 @@ class HomeAdvisorScraper:
             try:
                 page_text = self.driver.page_source
                 # Look for "Showing X-Y of Z" pattern
-                match = re.search(r'(?:Showing\s+)?\d+-\d+\s+of\s+(\d+)', page_text, re.IGNORECASE)
+                match = _TOTAL_ITEMS_RE.search(page_text)
                 if match:
                     total_items = int(match.group(1))
                     total_pages = (total_items + 9) // 10
@@ -357,7 +1004,7 @@ class HomeAdvisorScraper:
                     href = link.get_attribute('href') or ''
                     text = link.text.strip()
                     # Extract page number from href
-                    match = re.search(r'page=(\d+)', href)
+                    match = _PAGE_PARAM_RE.search(href)
                     if match:
                         page_num = int(match.group(1))
                         max_page = max(max_page, page_num)
@@ -383,16 +1030,7 @@ class HomeAdvisorScraper:
     def check_for_captcha(self):
         """Check if CAPTCHA is present on the page"""
         try:
-            page_source = self.driver.page_source.lower()
-            captcha_indicators = [
-                'captcha',
-                'recaptcha',
-                'challenge',
-                'verify you are human',
-                'cloudflare',
-                'access denied'
-            ]
-            return any(indicator in page_source for indicator in captcha_indicators)
+            return _CAPTCHA_RE.search(self.driver.page_source) is not None
         except:
             return False
     
@@ -421,17 +1059,8 @@ class HomeAdvisorScraper:
                     pass
             
             # Check if we're on a Cloudflare challenge page
-            page_source = self.driver.page_source.lower()
             current_url = self.driver.current_url
-            
-            is_cloudflare = any(indicator in page_source for indicator in [
-                'just a moment',
-                'cloudflare',
-                'verify you are human',
-                'checking your browser',
-                'cf-turnstile',
-                'challenges.cloudflare.com'
-            ])
+            is_cloudflare = _CLOUDFLARE_PAGE_RE.search(self.driver.page_source) is not None
             
             if not is_cloudflare:
                 return True  # Not a Cloudflare page, proceed
@@ -464,7 +1093,7 @@ class HomeAdvisorScraper:
                                 iframe = widget.find_element(By.TAG_NAME, 'iframe')
                                 iframe_src = iframe.get_attribute('src')
                                 # Extract site key from iframe src or page source
-                                match = re.search(r'sitekey=([^&]+)', iframe_src or '')
+                                match = _SITEKEY_PARAM_RE.search(iframe_src or '')
                                 if match:
                                     site_key = match.group(1)
                             except:
@@ -473,7 +1102,7 @@ class HomeAdvisorScraper:
                         # Also try to find site key in page source
                         if not site_key:
                             page_source_full = self.driver.page_source
-                            match = re.search(r'data-sitekey=["\']([^"\']+)["\']', page_source_full)
+                            match = _SITEKEY_ATTR_RE.search(page_source_full)
                             if match:
                                 site_key = match.group(1)
                         
@@ -542,7 +1171,7 @@ class HomeAdvisorScraper:
             while time.time() - start_time < max_wait:
                 try:
                     current_url = self.driver.current_url
-                    page_source = self.driver.page_source.lower()
+                    page_source = self.driver.page_source
                     
                     # When using undetected-chromedriver, prioritize checking for content
                     if self.using_undetected:
@@ -584,12 +1213,7 @@ class HomeAdvisorScraper:
                                 print("  ✓ Turnstile challenge token received, waiting for redirect...")
                                 time.sleep(3)  # Wait for redirect
                                 # Check if we're past the challenge
-                                page_source_after = self.driver.page_source.lower()
-                                if not any(indicator in page_source_after for indicator in [
-                                    'just a moment',
-                                    'verify you are human',
-                                    'checking your browser'
-                                ]):
+                                if not _CHALLENGE_PENDING_RE.search(self.driver.page_source):
                                     print("  ✓ Cloudflare challenge completed!")
                                     time.sleep(2)
                                     return True
@@ -597,11 +1221,7 @@ class HomeAdvisorScraper:
                         pass
                     
                     # Check if challenge is complete (we're no longer on challenge page)
-                    if not any(indicator in page_source for indicator in [
-                        'just a moment',
-                        'verify you are human',
-                        'checking your browser'
-                    ]):
+                    if not _CHALLENGE_PENDING_RE.search(page_source):
                         # Check if we can find HomeAdvisor content
                         try:
                             # Try to find HomeAdvisor-specific elements
@@ -636,15 +1256,10 @@ class HomeAdvisorScraper:
             
             # Final check if challenge passed
             try:
-                page_source = self.driver.page_source.lower()
                 current_url = self.driver.current_url
                 
                 # Check if we're past the challenge
-                if not any(indicator in page_source for indicator in [
-                    'just a moment',
-                    'verify you are human',
-                    'checking your browser'
-                ]):
+                if not _CHALLENGE_PENDING_RE.search(self.driver.page_source):
                     # Verify we have actual content
                     if 'homeadvisor' in current_url.lower():
                         has_content = any([
@@ -670,28 +1285,51 @@ class HomeAdvisorScraper:
             print(f"  Error waiting for Cloudflare challenge: {e}")
             return False
     
-    def scrape_listings_from_page(self, page_num):
+    def scrape_listings_from_page(self, page_num, try_http=True):
         """Scrape all business listings from a single page"""
+        return list(self.iter_listings_from_page(page_num, try_http))
+    
+    def iter_listings_from_page(self, page_num, try_http=True):
+        """Yield the business listings on a single page one at a time.
+        
+        Over HTTP the cards are parsed as they are consumed, so a caller that stops
+        early skips the rest; the browser fallback loads the whole page first.
+        Pass try_http=False when the page is already known to be blocked over HTTP.
+        """
         url = self.get_page_url(page_num)
         print(f"Scraping page {page_num}: {url}")
         
+        # The cards are server-rendered, so plain HTTP is enough unless the page is blocked
+        html = self._fetch_listing_html(url) if try_http else None
+        found = 0
+        for business_data in _iter_listing_html(html) if html else ():
+            found += 1
+            yield business_data
+        if found:
+            logger.info("Found %d listings on page %d over HTTP", found, page_num)
+        else:
+            yield from self._scrape_listings_in_browser(page_num, url)
+    
+    def _scrape_listings_in_browser(self, page_num, url):
         try:
             # Use Selenium for JavaScript rendering
+            self._limiter.acquire()
             self.driver.get(url)
             
             # Random delay to appear more human-like (3-7 seconds)
-            time.sleep(random.uniform(3, 7))
+            time.sleep(3.0 + 4.0 * _rand())
             
             # Wait for Cloudflare challenge if present
             if not self.wait_for_cloudflare_challenge():
                 print(f"⚠️  Cloudflare challenge not resolved on page {page_num}, skipping...")
+                self._limiter.backoff()
                 return []
+            self._limiter.success()
             
             # Check for other CAPTCHAs
             if self.check_for_captcha():
                 # If it's not Cloudflare, it might be a different CAPTCHA
-                page_source = self.driver.page_source.lower()
-                if 'cloudflare' not in page_source:
+                if not _CLOUDFLARE_RE.search(self.driver.page_source):
                     print(f"⚠️  CAPTCHA detected on page {page_num}!")
                     if self.headless:
                         print("   Running in headless mode. Switch to non-headless mode to solve CAPTCHA manually.")
@@ -819,10 +1457,135 @@ class HomeAdvisorScraper:
             
         except Exception as e:
             print(f"Error scraping page {page_num}: {e}")
-            import traceback
             traceback.print_exc()
             return []
     
+    def _async_client(self):
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=15,
+            follow_redirects=True,
+            headers={'User-Agent': self.user_agent},
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        )
+    
+    def _observe_page(self, response):
+        """_page_html of a HomeAdvisor response, feeding the rate limiter on the way"""
+        html = _page_html(response)
+        # A challenge page is congestion too, even when it comes back as 200
+        self._limiter.observe(response.status_code, challenged=response.status_code == 200 and html is None)
+        return html
+    
+    async def fetch_listing_page(self, client, page_num):
+        """Fetch a listing page's HTML over HTTP, or None if it needs the browser"""
+        await self._limiter.acquire_async()
+        try:
+            response = await client.get(self.get_page_url(page_num))
+        except httpx.HTTPError as e:
+            print(f"  Could not fetch page {page_num} over HTTP: {e}")
+            return None
+        return self._observe_page(response)
+    
+    async def _fetch_listing_pages(self, page_nums, client):
+        semaphore = asyncio.Semaphore(LISTING_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+        
+        async def fetch_and_parse(client, page_num):
+            async with semaphore:
+                html = await self.fetch_listing_page(client, page_num)
+            if html is None:
+                return None
+            # Parse in a worker thread so the event loop keeps other requests moving
+            return await loop.run_in_executor(None, _parse_listing_html, html)
+        
+        results = await asyncio.gather(
+            *(fetch_and_parse(client, page_num) for page_num in page_nums), return_exceptions=True)
+        return {page_num: result if isinstance(result, list) else None
+                for page_num, result in zip(page_nums, results)}
+    
+    async def _prefetch_listing_pages(self, page_nums, client=None):
+        page_nums = list(page_nums)
+        if not FAST_HTTP_AVAILABLE or not page_nums:
+            return {}
+        try:
+            if client is not None:
+                return await self._fetch_listing_pages(page_nums, client)
+            async with self._async_client() as client:
+                return await self._fetch_listing_pages(page_nums, client)
+        except Exception as e:
+            print(f"⚠️  Could not prefetch pages over HTTP, using the browser instead: {e}")
+            return {}
+    
+    def prefetch_listing_pages(self, page_nums):
+        """Fetch and parse several listing pages concurrently over HTTP.
+        
+        Returns {page_num: listings}; a page maps to None when it was blocked or
+        had no cards, so the caller can fall back to the browser for it.
+        """
+        return asyncio.run(self._prefetch_listing_pages(page_nums))
+    
+    async def _fetch_profile_html(self, client, profile_url):
+        """Fetch a profile page's HTML over HTTP, or None if it needs the browser"""
+        await self._limiter.acquire_async()
+        try:
+            response = await client.get(profile_url)
+        except httpx.HTTPError as e:
+            print(f"  Could not fetch {profile_url} over HTTP: {e}")
+            return None
+        return self._observe_page(response)
+    
+    async def get_data_from_profile_page_async(self, profile_url, client=None):
+        """Like get_data_from_profile_page, but over HTTP without a browser.
+        
+        Uses client if given, else the running pipeline's shared client when called
+        on the pipeline's event loop, else a client opened just for this call. The
+        page is parsed in a worker thread (selectolax releases the GIL while parsing).
+        Returns None when the page was blocked and has to be loaded in the browser,
+        or when httpx/selectolax aren't installed.
+        """
+        if not FAST_HTTP_AVAILABLE:
+            return None
+        if client is None and self._shared_async_loop is asyncio.get_running_loop():
+            client = self._shared_async_client
+        if client is None:
+            async with self._async_client() as client:
+                return await self.get_data_from_profile_page_async(profile_url, client)
+        html = await self._fetch_profile_html(client, profile_url)
+        if html is None:
+            return None
+        return await asyncio.get_running_loop().run_in_executor(None, _parse_profile_html, html)
+    
+    def fetch_profile_data(self, profile_urls):
+        """Get the profile data (address, website, phone) for several profile pages at once.
+        
+        The pages are visited with every pooled browser at once; the browser is
+        needed because the phone is only revealed by clicking "view-phone-number".
+        Returns {profile_url: profile data}; each distinct URL is visited once.
+        """
+        profile_urls = list(dict.fromkeys(profile_urls))
+        if not profile_urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=self.enrich_workers) as executor:
+            return dict(zip(profile_urls, executor.map(self._visit_profile_page, profile_urls)))
+    
+    def _visit_profile_page(self, profile_url):
+        """Return get_data_from_profile_page's data for a profile, loaded in a pooled browser"""
+        with self._borrow_driver():
+            return self.get_data_from_profile_page(profile_url)
+    
+    def _fetch_listing_html(self, url):
+        """Fetch a listing page without the browser, or None if that didn't work"""
+        if self._http is None:
+            return None
+        self._limiter.acquire()
+        try:
+            response = self._http.get(url)
+            html = self._observe_page(response)
+        except httpx.HTTPError as e:
+            print(f"  Could not fetch {url} over HTTP: {e}")
+            return None
+        return html
+    
     def extract_business_info_from_card(self, card_element):
         """Extract business information from a business card element on the listing page"""
         data = {
@@ -838,31 +1601,24 @@ class HomeAdvisorScraper:
         
         try:
             # Extract business name - try desktop first, then mobile, then fallbacks
-            try:
-                name_elem = card_element.find_element(By.CSS_SELECTOR, 'h3[data-testid="business-name-desktop"]')
-                data['business_name'] = name_elem.text.strip()
-            except:
+            for selector in _CARD_NAME_SELECTORS:
                 try:
-                    name_elem = card_element.find_element(By.CSS_SELECTOR, 'h3[data-testid="business-name-mobile"]')
-                    data['business_name'] = name_elem.text.strip()
+                    data['business_name'] = card_element.find_element(By.CSS_SELECTOR, selector).text.strip()
+                    break
                 except:
-                    # Fallback: try any h3 with BusinessProfileCard_header class
-                    try:
-                        name_elem = card_element.find_element(By.CSS_SELECTOR, 'h3.BusinessProfileCard_header__srI3D')
-                        data['business_name'] = name_elem.text.strip()
-                    except:
-                        # Last resort: try aria-label from profile link
-                        try:
-                            profile_link = card_element.find_element(By.CSS_SELECTOR, 'a[data-testid="profile-link"]')
-                            aria_label = profile_link.get_attribute('aria-label')
-                            if aria_label:
-                                # Extract name from aria-label like "AK Aire, LLC profile (opens in new tab)"
-                                import re
-                                match = re.search(r'^([^(]+)', aria_label)
-                                if match:
-                                    data['business_name'] = match.group(1).strip()
-                        except:
-                            pass
+                    continue
+            else:
+                # Last resort: try aria-label from profile link
+                try:
+                    profile_link = card_element.find_element(By.CSS_SELECTOR, 'a[data-testid="profile-link"]')
+                    aria_label = profile_link.get_attribute('aria-label')
+                    if aria_label:
+                        # Extract name from aria-label like "AK Aire, LLC profile (opens in new tab)"
+                        match = _ARIA_NAME_RE.search(aria_label)
+                        if match:
+                            data['business_name'] = match.group(1).strip()
+                except:
+                    pass
             
             # Extract profile URL - try multiple selectors
             try:
@@ -876,72 +1632,29 @@ class HomeAdvisorScraper:
                     profile_link = card_element.find_element(By.CSS_SELECTOR, 'a[href*="rated"], a[href*="/pro/"]')
                     href = profile_link.get_attribute('href')
                     if href and ('rated' in href or '/pro/' in href):
-                        # Make sure it's a full URL
-                        if not href.startswith('http'):
-                            if href.startswith('/'):
-                                href = 'https://www.homeadvisor.com' + href
-                            else:
-                                href = 'https://www.homeadvisor.com/' + href
+                        href = _absolute_url(href)
                         data['profile_url'] = href
                 except:
                     # Try to find profile URL from JSON-LD structured data
                     try:
                         # Get the page source and look for JSON-LD with this business name
                         page_source = self.driver.page_source
-                        import json
-                        import re
                         
                         # Find all JSON-LD script tags
-                        json_ld_pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-                        matches = re.findall(json_ld_pattern, page_source, re.DOTALL | re.IGNORECASE)
+                        matches = _JSON_LD_RE.findall(page_source)
                         
                         business_name_lower = data['business_name'].lower() if data['business_name'] else ''
                         
                         for json_text in matches:
                             try:
-                                json_data = json.loads(json_text)
-                                
-                                # Look for the business in the JSON structure
-                                def find_business_in_json(obj, target_name):
-                                    """Recursively search for business data in JSON"""
-                                    if isinstance(obj, dict):
-                                        # Check if this is a business object with matching name
-                                        if '@type' in obj:
-                                            obj_type = str(obj.get('@type', ''))
-                                            if 'HomeAndConstructionBusiness' in obj_type or 'LocalBusiness' in obj_type:
-                                                if 'name' in obj and target_name.lower() in obj['name'].lower():
-                                                    if 'url' in obj:
-                                                        url = obj['url']
-                                                        if url and ('rated' in url or '/pro/' in url):
-                                                            return url
-                                        # Check itemListElement for businesses
-                                        if 'itemListElement' in obj:
-                                            for item in obj['itemListElement']:
-                                                if 'item' in item:
-                                                    result = find_business_in_json(item['item'], target_name)
-                                                    if result:
-                                                        return result
-                                        # Recursively search all values
-                                        for value in obj.values():
-                                            result = find_business_in_json(value, target_name)
-                                            if result:
-                                                return result
-                                    elif isinstance(obj, list):
-                                        for item in obj:
-                                            result = find_business_in_json(item, target_name)
-                                            if result:
-                                                return result
-                                    return None
+                                json_data = _load_json_ld(json_text)
+                                if json_data is None:
+                                    continue
                                 
                                 if business_name_lower:
-                                    profile_url = find_business_in_json(json_data, business_name_lower)
+                                    profile_url = _find_business_url_in_json(json_data, business_name_lower)
                                     if profile_url:
-                                        # Make sure it's a full URL
-                                        if not profile_url.startswith('http'):
-                                            if profile_url.startswith('/'):
-                                                profile_url = 'https://www.homeadvisor.com' + profile_url
-                                            else:
-                                                profile_url = 'https://www.homeadvisor.com/' + profile_url
+                                        profile_url = _absolute_url(profile_url)
                                         data['profile_url'] = profile_url
                                         break
                             except:
@@ -949,49 +1662,30 @@ class HomeAdvisorScraper:
                     except:
                         pass
             
-            # Extract star rating
-            try:
-                # Try desktop rating first
+            # Extract star rating - desktop, then mobile, then without data-testid
+            for selector in _CARD_RATING_SELECTORS:
                 try:
-                    rating_elem = card_element.find_element(By.CSS_SELECTOR, 'div[data-testid="star-rating-desktop"] span.RatingsLockup_ratingNumber__2CoLI')
+                    rating_elem = card_element.find_element(By.CSS_SELECTOR, selector)
                     rating_text = rating_elem.text.strip()
                     if not rating_text:
                         # Try getting textContent or innerText
                         rating_text = rating_elem.get_attribute('textContent') or rating_elem.get_attribute('innerText')
-                    if rating_text:
-                        data['star_rating'] = rating_text.strip()
                 except:
-                    # Try mobile rating
-                    try:
-                        rating_elem = card_element.find_element(By.CSS_SELECTOR, 'div[data-testid="star-rating-mobile"] span.RatingsLockup_ratingNumber__2CoLI')
-                        rating_text = rating_elem.text.strip()
-                        if not rating_text:
-                            rating_text = rating_elem.get_attribute('textContent') or rating_elem.get_attribute('innerText')
-                        if rating_text:
-                            data['star_rating'] = rating_text.strip()
-                    except:
-                        # Fallback: try without data-testid
-                        try:
-                            rating_elem = card_element.find_element(By.CSS_SELECTOR, 'span.RatingsLockup_ratingNumber__2CoLI')
-                            rating_text = rating_elem.text.strip()
-                            if not rating_text:
-                                rating_text = rating_elem.get_attribute('textContent') or rating_elem.get_attribute('innerText')
-                            if rating_text:
-                                data['star_rating'] = rating_text.strip()
-                        except:
-                            # Last resort: extract from aria-label
-                            try:
-                                rating_container = card_element.find_element(By.CSS_SELECTOR, 'div[aria-label*="Rating:"]')
-                                aria_label = rating_container.get_attribute('aria-label')
-                                if aria_label:
-                                    import re
-                                    match = re.search(r'Rating:\s*([\d.]+)', aria_label)
-                                    if match:
-                                        data['star_rating'] = match.group(1)
-                            except:
-                                pass
-            except:
-                pass
+                    continue
+                if rating_text:
+                    data['star_rating'] = rating_text.strip()
+                break
+            else:
+                # Last resort: extract from aria-label
+                try:
+                    rating_container = card_element.find_element(By.CSS_SELECTOR, 'div[aria-label*="Rating:"]')
+                    aria_label = rating_container.get_attribute('aria-label')
+                    if aria_label:
+                        match = _ARIA_RATING_RE.search(aria_label)
+                        if match:
+                            data['star_rating'] = match.group(1)
+                except:
+                    pass
             
             # Extract number of reviews - handle "No reviews yet" cases
             try:
@@ -1003,48 +1697,21 @@ class HomeAdvisorScraper:
                     if not data['star_rating']:
                         data['star_rating'] = ''
                 else:
-                    # Try desktop reviews first
-                    try:
-                        reviews_elem = card_element.find_element(By.CSS_SELECTOR, 'div[data-testid="star-rating-desktop"] span.RatingsLockup_reviewCount__u0DTP')
-                        # The number is inside a div
-                        review_div = reviews_elem.find_element(By.TAG_NAME, 'div')
-                        reviews_text = review_div.text.strip()
-                        if not reviews_text:
-                            reviews_text = review_div.get_attribute('textContent') or review_div.get_attribute('innerText')
-                        # Remove parentheses if present
-                        if reviews_text:
-                            reviews_text = reviews_text.strip('()')
-                            # Check if it's a number
-                            if reviews_text.isdigit():
-                                data['num_reviews'] = reviews_text.strip()
-                    except:
-                        # Try mobile reviews
+                    # Desktop, then mobile, then without data-testid; the number is inside a div
+                    for selector in _CARD_REVIEWS_SELECTORS:
                         try:
-                            reviews_elem = card_element.find_element(By.CSS_SELECTOR, 'div[data-testid="star-rating-mobile"] span.RatingsLockup_reviewCount__u0DTP')
-                            review_div = reviews_elem.find_element(By.TAG_NAME, 'div')
+                            review_div = card_element.find_element(By.CSS_SELECTOR, selector)
                             reviews_text = review_div.text.strip()
                             if not reviews_text:
                                 reviews_text = review_div.get_attribute('textContent') or review_div.get_attribute('innerText')
-                            if reviews_text:
-                                reviews_text = reviews_text.strip('()')
-                                # Check if it's a number
-                                if reviews_text.isdigit():
-                                    data['num_reviews'] = reviews_text.strip()
                         except:
-                            # Fallback: try without data-testid
-                            try:
-                                reviews_elem = card_element.find_element(By.CSS_SELECTOR, 'span.RatingsLockup_reviewCount__u0DTP')
-                                review_div = reviews_elem.find_element(By.TAG_NAME, 'div')
-                                reviews_text = review_div.text.strip()
-                                if not reviews_text:
-                                    reviews_text = review_div.get_attribute('textContent') or review_div.get_attribute('innerText')
-                                if reviews_text:
-                                    reviews_text = reviews_text.strip('()')
-                                    # Check if it's a number
-                                    if reviews_text.isdigit():
-                                        data['num_reviews'] = reviews_text.strip()
-                            except:
-                                pass
+                            continue
+                        # Remove parentheses if present and check it's a number
+                        if reviews_text:
+                            reviews_text = reviews_text.strip('()')
+                            if reviews_text.isdigit():
+                                data['num_reviews'] = reviews_text.strip()
+                        break
             except:
                 pass
             
@@ -1056,56 +1723,22 @@ class HomeAdvisorScraper:
                     try:
                         # Get the page source and look for JSON-LD with this business name
                         page_source = self.driver.page_source
-                        import json
-                        import re
                         
                         # Find all JSON-LD script tags
-                        json_ld_pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-                        matches = re.findall(json_ld_pattern, page_source, re.DOTALL | re.IGNORECASE)
+                        matches = _JSON_LD_RE.findall(page_source)
                         
                         for json_text in matches:
                             try:
-                                json_data = json.loads(json_text)
+                                json_data = _load_json_ld(json_text)
+                                if json_data is None:
+                                    continue
                                 # Check if this JSON contains the business name
                                 business_name_lower = data['business_name'].lower() if data['business_name'] else ''
                                 
-                                # Look for the business in the JSON structure
-                                def find_business_in_json(obj, target_name):
-                                    """Recursively search for business data in JSON"""
-                                    if isinstance(obj, dict):
-                                        # Check if this is a business object with matching name
-                                        if '@type' in obj and 'HomeAndConstructionBusiness' in str(obj.get('@type', '')):
-                                            if 'name' in obj and target_name.lower() in obj['name'].lower():
-                                                if 'url' in obj:
-                                                    return obj['url']
-                                        # Check itemListElement for businesses
-                                        if 'itemListElement' in obj:
-                                            for item in obj['itemListElement']:
-                                                if 'item' in item:
-                                                    result = find_business_in_json(item['item'], target_name)
-                                                    if result:
-                                                        return result
-                                        # Recursively search all values
-                                        for value in obj.values():
-                                            result = find_business_in_json(value, target_name)
-                                            if result:
-                                                return result
-                                    elif isinstance(obj, list):
-                                        for item in obj:
-                                            result = find_business_in_json(item, target_name)
-                                            if result:
-                                                return result
-                                    return None
-                                
                                 if business_name_lower:
-                                    profile_url = find_business_in_json(json_data, business_name_lower)
+                                    profile_url = _find_business_url_in_json(json_data, business_name_lower)
                                     if profile_url:
-                                        # Make sure it's a full URL
-                                        if not profile_url.startswith('http'):
-                                            if profile_url.startswith('/'):
-                                                profile_url = 'https://www.homeadvisor.com' + profile_url
-                                            else:
-                                                profile_url = 'https://www.homeadvisor.com/' + profile_url
+                                        profile_url = _absolute_url(profile_url)
                                         data['profile_url'] = profile_url
                                         break
                             except:
@@ -1122,10 +1755,8 @@ class HomeAdvisorScraper:
                 for script in script_tags:
                     script_type = script.get_attribute('type')
                     if script_type == 'application/ld+json':
-                        import json
-                        json_text = script.get_attribute('innerHTML')
-                        if json_text:
-                            json_data = json.loads(json_text)
+                        json_data = _load_json_ld(script.get_attribute('innerHTML') or '')
+                        if json_data is not None:
                             # Navigate through the JSON structure to find address
                             if '@type' in json_data and json_data['@type'] == 'SearchResultsPage':
                                 if 'mainEntity' in json_data and 'itemListElement' in json_data['mainEntity']:
@@ -1141,114 +1772,53 @@ class HomeAdvisorScraper:
         
         return data
     
-    def extract_business_info(self, container):
-        """Extract business information from a listing container"""
-        data = {
-            'business_name': '',
-            'star_rating': '',
-            'num_reviews': '',
-            'address': '',
-            'website': '',
-            'phone': '',
-            'email': ''
-        }
-        
-        container_text = container.get_text()
+    def _get_page_text(self, url):
+        """Get the visible text of a business website, or None if it can't be read.
         
-        # Extract business name and profile URL - multiple strategies
-        # Strategy 1: Look for /pro/ or /rated. links (most reliable)
-        pro_link = container.find('a', href=re.compile(r'/pro/|/rated\.', re.I))
-        if pro_link:
-            name_text = pro_link.get_text(strip=True)
-            # Filter out promotional text
-            if name_text and not any(skip in name_text.lower() for skip in ['join', 'sign up', 'become', 'register']):
-                data['business_name'] = name_text
-                
-            # Extract profile URL
-            href = pro_link.get('href', '')
-            if href:
-                if href.startswith('/'):
-                    data['profile_url'] = urljoin('https://www.homeadvisor.com', href)
-                elif href.startswith('http'):
-                    data['profile_url'] = href
-                else:
-                    data['profile_url'] = urljoin('https://www.homeadvisor.com', href)
-        
-        # Strategy 2: Look for headings
-        if not data['business_name']:
-            for tag in ['h1', 'h2', 'h3', 'h4']:
-                name_elem = container.find(tag)
-                if name_elem:
-                    name_text = name_elem.get_text(strip=True)
-                    if name_text and len(name_text) > 2 and len(name_text) < 100:
-                        data['business_name'] = name_text
-                        break
-        
-        # Strategy 3: Look for strong/bold text at the beginning
-        if not data['business_name']:
-            strong_elem = container.find(['strong', 'b'])
-            if strong_elem:
-                name_text = strong_elem.get_text(strip=True)
-                if name_text and len(name_text) > 2 and len(name_text) < 100:
-                    data['business_name'] = name_text
-        
-        # Extract star rating - look for patterns like "4.5 stars" or "★★★★"
-        rating_patterns = [
-            r'(\d+\.?\d*)\s*[Ss]tar',
-            r'(\d+\.?\d*)\s*out\s*of\s*\d+',
-            r'Rating[:\s]*(\d+\.?\d*)',
-        ]
-        for pattern in rating_patterns:
-            match = re.search(pattern, container_text)
-            if match:
-                data['star_rating'] = match.group(1)
-                break
-        
-        # Extract number of reviews
-        reviews_patterns = [
-            r'(\d+(?:,\d+)*)\s*[Rr]eview',
-            r'(\d+(?:,\d+)*)\s*[Rr]ating',
-        ]
-        for pattern in reviews_patterns:
-            match = re.search(pattern, container_text)
-            if match:
-                data['num_reviews'] = match.group(1).replace(',', '')
-                break
+        The last page read by this thread is remembered, because find_phone_on_website
+        and find_email_on_website usually read the same website back to back.
+        """
+        last = getattr(self._local, 'last_page', None)
+        if last is not None and last[0] == url:
+            return last[1]
+        page_text = self._fetch_page_text(url)
+        self._local.last_page = (url, page_text)
+        return page_text
+    
+    def _fetch_page_text(self, url):
+        """Fetch the visible text of a page, or None if it can't be read.
         
-        # Extract address - look for address patterns
-        address_patterns = [
-            r'\d+\s+[A-Za-z0-9\s,]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Place|Pl)[\s,]+[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}',
-            r'[A-Za-z0-9\s,]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Way|Place|Pl)[\s,]+[A-Za-z\s]+,\s*[A-Z]{2}',
-        ]
-        for pattern in address_patterns:
-            match = re.search(pattern, container_text)
-            if match:
-                data['address'] = match.group(0).strip()
-                break
+        Plain HTTP is tried first; the browser is only used when the page looks
+        JavaScript-rendered or sits behind a Cloudflare challenge.
+        """
+        if self._http is not None:
+            try:
+                response = self._http.get(url)
+                html = response.text
+                if not any(marker in html for marker in _CHALLENGE_MARKERS):
+                    if response.status_code != 200:
+                        return None
+                    tree = LexborHTMLParser(html)
+                    tree.strip_tags(['script', 'style', 'noscript'])
+                    page_text = tree.body.text(separator=' ') if tree.body else ''
+                    if page_text.strip():
+                        return page_text
+            except httpx.HTTPError as e:
+                print(f"  Could not fetch {url}: {e}")
+                return None
         
-        # If no pattern match, try to find address element
-        if not data['address']:
-            address_elem = container.find(['span', 'div', 'p'], class_=re.compile(r'(address|location|city)', re.I))
-            if not address_elem:
-                address_elem = container.find('address')
-            if address_elem:
-                addr_text = address_elem.get_text(strip=True)
-                if addr_text and len(addr_text) > 10:
-                    data['address'] = addr_text
-        
-        # Extract website URL - look for external links
-        website_links = container.find_all('a', href=re.compile(r'^https?://', re.I))
-        for link in website_links:
-            href = link.get('href', '')
-            # Skip HomeAdvisor links and common social media
-            if href and not any(skip in href.lower() for skip in ['homeadvisor.com', 'facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com']):
-                data['website'] = href
-                break
+        # Fall back to Selenium for JavaScript-rendered pages
+        if self.driver.current_url != url:
+            self.driver.get(url)
+            time.sleep(2.0 + 2.0 * _rand())
         
-        # If no external link found, the website might be on the business profile page
-        # We'll need to visit the /pro/ link to get it
+        # Check for CAPTCHA
+        if self.check_for_captcha():
+            print("  ⚠️  CAPTCHA detected on website, skipping...")
+            return None
         
-        return data
+        # Get page text using Selenium (one script call instead of find_element + .text)
+        return self.driver.execute_script(_BODY_TEXT_SCRIPT)
     
     def find_phone_on_website(self, url):
         """Search for phone number on a business website"""
@@ -1257,65 +1827,31 @@ class HomeAdvisorScraper:
         
         try:
             print(f"  Searching for phone on: {url}")
-            # Random delay before request
-            time.sleep(random.uniform(1, 3))
-            
-            # Use Selenium to visit the website
-            self.driver.get(url)
-            time.sleep(random.uniform(2, 4))
-            
-            # Check for CAPTCHA
-            if self.check_for_captcha():
-                print("  ⚠️  CAPTCHA detected on website, skipping...")
+            page_text = self._get_page_text(url)
+            if page_text is None:
                 return None
             
-            # Get page text using Selenium
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
-            
-            # Common phone number patterns
-            phone_patterns = [
-                r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890
-                r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',        # 123-456-7890
-                r'\+?1[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # +1 (123) 456-7890
-            ]
-            
-            for pattern in phone_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    # Clean up the phone number
-                    phone = re.sub(r'[^\d]', '', matches[0])
-                    if len(phone) == 10 or (len(phone) == 11 and phone[0] == '1'):
-                        if len(phone) == 11:
-                            phone = phone[1:]
-                        return f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
-            
-            return None
+            return _find_phone(page_text)
             
         except Exception as e:
             print(f"  Error searching website {url}: {e}")
             return None
     
     def find_email_on_website(self, url):
-        """Search for email address on a business website using Selenium"""
+        """Search for email address on a business website"""
         if not url or not url.startswith('http'):
             return None
         
         try:
-            # Use Selenium to visit the website (if not already there)
-            current_url = self.driver.current_url
-            if current_url != url:
-                self.driver.get(url)
-                time.sleep(random.uniform(2, 4))
-            
-            # Get page text using Selenium
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
+            page_text = self._get_page_text(url)
+            if page_text is None:
+                return None
             
             # Email pattern
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            matches = re.findall(email_pattern, page_text)
+            matches = _EMAIL_RE.findall(page_text)
             
             # Filter out common non-business emails
-            filtered = [e for e in matches if not any(x in e.lower() for x in ['example.com', 'test.com', 'placeholder'])]
+            filtered = [e for e in matches if not _EMAIL_SKIP_RE.search(e)]
             
             if filtered:
                 return filtered[0]
@@ -1326,8 +1862,29 @@ class HomeAdvisorScraper:
             print(f"  Error finding email on {url}: {e}")
             return None
     
+    def _cache_get(self, key):
+        """Return a cached lookup result, or None"""
+        if self._query_cache is None:
+            return None
+        return self._query_cache.get(key)
+    
+    def _cache_set(self, key, value):
+        """Remember a successful lookup result (failures are retried next run)"""
+        if self._query_cache is not None and value:
+            self._query_cache.set(key, value, expire=CACHE_EXPIRE)
+    
     def search_google_for_phone(self, business_name, address):
-        """Search Google for business phone number"""
+        """Search Google for business phone number (cached between runs)"""
+        key = f"google:{business_name}|{address}"
+        phone = self._cache_get(key)
+        if phone:
+            logger.info("  Using cached Google result for: %s", business_name)
+            return phone
+        phone = self._search_google_for_phone(business_name, address)
+        self._cache_set(key, phone)
+        return phone
+    
+    def _search_google_for_phone(self, business_name, address):
         try:
             query = f"{business_name} {address} phone number"
             from urllib.parse import quote
@@ -1337,7 +1894,7 @@ class HomeAdvisorScraper:
             
             self.driver.get(google_url)
             # Random delay to appear more human-like
-            time.sleep(random.uniform(2, 4))
+            time.sleep(2.0 + 2.0 * _rand())
             
             # Check for CAPTCHA on Google
             if self.check_for_captcha():
@@ -1345,29 +1902,36 @@ class HomeAdvisorScraper:
                 return None
             
             # Get page text using Selenium
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
+            page_text = self.driver.execute_script(_BODY_TEXT_SCRIPT)
             
             # Look for phone numbers in the results
-            phone_patterns = [
-                r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-                r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
-            ]
-            
-            for pattern in phone_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    phone = re.sub(r'[^\d]', '', matches[0])
-                    if len(phone) == 10 or (len(phone) == 11 and phone[0] == '1'):
-                        if len(phone) == 11:
-                            phone = phone[1:]
-                        return f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
-            
-            return None
+            return _find_phone(page_text)
             
         except Exception as e:
             print(f"  Error searching Google: {e}")
             return None
     
+    def _profile_contact_from_driver(self):
+        """Read the address and website off the loaded profile page through WebDriver"""
+        address = website = ''
+        for selector in _PROFILE_ADDRESS_SELECTORS:
+            try:
+                address_text = self.driver.find_element(By.CSS_SELECTOR, selector).text.strip()
+            except:
+                continue
+            if len(address_text) > 10:
+                address = address_text
+            break
+        for selector in _PROFILE_WEBSITE_SELECTORS:
+            try:
+                href = self.driver.find_element(By.CSS_SELECTOR, selector).get_attribute('href')
+            except:
+                continue
+            if href and href.startswith('http') and not _WEBSITE_SKIP_RE.search(href):
+                website = href
+            break
+        return address, website
+    
     def get_data_from_profile_page(self, profile_url):
         """Extract all data from a business profile page using specific selectors"""
         data = {
@@ -1379,20 +1943,22 @@ class HomeAdvisorScraper:
         }
         
         try:
-            print(f"  Visiting profile page: {profile_url}")
+            logger.info("  Visiting profile page: %s", profile_url)
+            self._limiter.acquire()
             self.driver.get(profile_url)
-            time.sleep(random.uniform(3, 5))
+            time.sleep(3.0 + 2.0 * _rand())
             
             # Wait for Cloudflare challenge if present
             if not self.wait_for_cloudflare_challenge():
                 print("  ⚠️  Cloudflare challenge not resolved, skipping...")
+                self._limiter.backoff()
                 return data
+            self._limiter.success()
             
             # Check for other CAPTCHAs
             if self.check_for_captcha():
                 # If it's not Cloudflare, it might be a different CAPTCHA
-                page_source = self.driver.page_source.lower()
-                if 'cloudflare' not in page_source:
+                if not _CLOUDFLARE_RE.search(self.driver.page_source):
                     print("  ⚠️  CAPTCHA detected on profile page, skipping...")
                     if not self.headless:
                         print("  Please solve the CAPTCHA manually...")
@@ -1404,73 +1970,23 @@ class HomeAdvisorScraper:
             # This prevents duplication
             # Rating and reviews are already extracted from the listing card
             
-            # Extract address - from contact information section
-            try:
-                # Look for address in h3 with class SubComponents_subHeader__JUXIF within contact information
-                address_elem = self.driver.find_element(By.CSS_SELECTOR, 
-                    'div[data-testid="contact-information-component"] h3.SubComponents_subHeader__JUXIF'
-                )
-                address_text = address_elem.text.strip()
-                if address_text and len(address_text) > 10:
-                    data['address'] = address_text
-            except:
-                # Fallback: try without data-testid
-                try:
-                    address_elem = self.driver.find_element(By.CSS_SELECTOR, 'h3.SubComponents_subHeader__JUXIF')
-                    address_text = address_elem.text.strip()
-                    if address_text and len(address_text) > 10:
-                        data['address'] = address_text
-                except:
-                    pass
-            
-            # Extract website - from contact information section
-            try:
-                # Look for website link in a tag with class SubComponents_link__Gpwoa within contact information
-                website_link = self.driver.find_element(By.CSS_SELECTOR, 
-                    'div[data-testid="contact-information-component"] a.SubComponents_link__Gpwoa'
-                )
-                href = website_link.get_attribute('href')
-                if href and href.startswith('http') and not any(skip in href.lower() for skip in [
-                    'homeadvisor.com', 'facebook.com', 'twitter.com', 
-                    'linkedin.com', 'instagram.com', 'youtube.com', 'pinterest.com'
-                ]):
-                    data['website'] = href
-            except:
-                # Fallback: try without data-testid
-                try:
-                    website_link = self.driver.find_element(By.CSS_SELECTOR, 'a.SubComponents_link__Gpwoa')
-                    href = website_link.get_attribute('href')
-                    if href and href.startswith('http') and not any(skip in href.lower() for skip in [
-                        'homeadvisor.com', 'facebook.com', 'twitter.com', 
-                        'linkedin.com', 'instagram.com', 'youtube.com', 'pinterest.com'
-                    ]):
-                        data['website'] = href
-                except:
-                    pass
+            # Address and website come from one parse of the page source instead of
+            # a WebDriver round trip per selector
+            if FAST_HTTP_AVAILABLE:
+                parsed = _parse_profile_html(self.driver.page_source)
+                data['address'] = parsed['address']
+                data['website'] = parsed['website']
+            else:
+                data['address'], data['website'] = self._profile_contact_from_driver()
             
             # Extract phone number - click the button with id="view-phone-number"
             # Try multiple selectors and wait for button to appear
             phone_button = None
             try:
                 # Wait for button to appear with multiple selector strategies
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-                
                 wait = WebDriverWait(self.driver, 10)
                 
-                # Try multiple selectors
-                selectors = [
-                    (By.ID, "view-phone-number"),
-                    (By.CSS_SELECTOR, "button#view-phone-number"),
-                    (By.CSS_SELECTOR, "[id='view-phone-number']"),
-                    (By.XPATH, "//button[@id='view-phone-number']"),
-                    (By.XPATH, "//button[contains(@aria-label, 'phone') or contains(@aria-label, 'Phone')]"),
-                    (By.XPATH, "//button[contains(text(), 'Phone') or contains(text(), 'phone')]"),
-                    (By.CSS_SELECTOR, "button[data-testid*='phone']"),
-                    (By.CSS_SELECTOR, "a[href*='phone']"),
-                ]
-                
-                for selector_type, selector_value in selectors:
+                for selector_type, selector_value in _PHONE_BUTTON_SELECTORS:
                     try:
                         phone_button = wait.until(EC.presence_of_element_located((selector_type, selector_value)))
                         if phone_button:
@@ -1490,86 +2006,38 @@ class HomeAdvisorScraper:
                     
                     # Now extract the phone number from the button that appears after clicking
                     try:
-                        # Look for the phone button with data-testid="angi_button" and class containing BusinessProfileHero_phoneNumber
-                        phone_button_after = self.driver.find_element(By.CSS_SELECTOR, 
-                            'button[data-testid="angi_button"][class*="BusinessProfileHero_phoneNumber"], '
-                            'button[class*="BusinessProfileHero_phoneNumber"]'
-                        )
-                        
-                        # Try to get phone from name attribute first (most reliable)
-                        phone_name = phone_button_after.get_attribute('name')
-                        if phone_name:
-                            # Extract phone number from name attribute (format: "(732) 416-7719")
-                            phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', phone_name)
-                            if phone_match:
-                                phone = re.sub(r'[^\d]', '', phone_match.group(0))
-                                if len(phone) == 10 or (len(phone) == 11 and phone[0] == '1'):
-                                    if len(phone) == 11:
-                                        phone = phone[1:]
-                                    data['phone'] = f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
-                        
-                        # If not found in name, try button text
-                        if not data['phone']:
-                            button_text = phone_button_after.text
-                            phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', button_text)
-                            if phone_match:
-                                phone = re.sub(r'[^\d]', '', phone_match.group(0))
-                                if len(phone) == 10 or (len(phone) == 11 and phone[0] == '1'):
-                                    if len(phone) == 11:
-                                        phone = phone[1:]
-                                    data['phone'] = f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
+                        # Read the revealed phone button's name and text in a single round-trip
+                        phone_button_after = self.driver.execute_script(_PHONE_BUTTON_SCRIPT)
+                        if phone_button_after:
+                            # Try to get phone from name attribute first (most reliable)
+                            phone_name = phone_button_after.get('name')
+                            if phone_name:
+                                # Extract phone number from name attribute (format: "(732) 416-7719")
+                                data['phone'] = _find_phone(phone_name) or ''
+                            
+                            # If not found in name, try button text
+                            if not data['phone']:
+                                button_text = phone_button_after.get('text') or ''
+                                data['phone'] = _find_phone(button_text) or ''
                     except:
                         pass
                     
                     # Also search the entire page text for phone patterns
                     if not data['phone']:
-                        page_text = self.driver.find_element(By.TAG_NAME, "body").text
-                        phone_patterns = [
-                            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-                            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
-                        ]
-                        for pattern in phone_patterns:
-                            matches = re.findall(pattern, page_text)
-                            if matches:
-                                # Filter out common false positives
-                                for match in matches:
-                                    phone = re.sub(r'[^\d]', '', match)
-                                    if len(phone) == 10 or (len(phone) == 11 and phone[0] == '1'):
-                                        if len(phone) == 11:
-                                            phone = phone[1:]
-                                        # Check if it's a valid phone number (not a date, etc.)
-                                        if phone[0] in ['2', '3', '4', '5', '6', '7', '8', '9']:
-                                            data['phone'] = f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
-                                            break
-                                if data['phone']:
-                                    break
+                        page_text = self.driver.execute_script(_BODY_TEXT_SCRIPT)
+                        # Filter out common false positives (dates, etc.)
+                        data['phone'] = _find_phone(page_text, skip_invalid_area_codes=True) or ''
             except Exception as e:
                 print(f"  Could not find or click phone button: {e}")
                 # Try to extract phone from page source directly (might be visible without clicking)
                 try:
                     page_source = self.driver.page_source
-                    page_text = self.driver.find_element(By.TAG_NAME, "body").text
+                    page_text = self.driver.execute_script(_BODY_TEXT_SCRIPT)
                     
-                    # Look for phone patterns in the page
-                    phone_patterns = [
-                        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-                        r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
-                    ]
-                    for pattern in phone_patterns:
-                        matches = re.findall(pattern, page_text)
-                        if matches:
-                            for match in matches:
-                                phone = re.sub(r'[^\d]', '', match)
-                                if len(phone) == 10 or (len(phone) == 11 and phone[0] == '1'):
-                                    if len(phone) == 11:
-                                        phone = phone[1:]
-                                    # Check if it's a valid phone number (not a date, etc.)
-                                    if phone[0] in ['2', '3', '4', '5', '6', '7', '8', '9']:
-                                        data['phone'] = f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
-                                        print(f"  Found phone number in page text: {data['phone']}")
-                                        break
-                            if data['phone']:
-                                break
+                    # Look for phone patterns in the page, skipping dates and other false positives
+                    data['phone'] = _find_phone(page_text, skip_invalid_area_codes=True) or ''
+                    if data['phone']:
+                        print(f"  Found phone number in page text: {data['phone']}")
                 except Exception as e2:
                     print(f"  Could not extract phone from page: {e2}")
                     pass
@@ -1578,16 +2046,26 @@ class HomeAdvisorScraper:
             
         except Exception as e:
             print(f"  Error extracting data from profile page: {e}")
-            import traceback
             traceback.print_exc()
             return data
     
     def search_profile_url(self, business_name):
-        """Try to find profile URL by searching HomeAdvisor for the business name"""
+        """Try to find profile URL by searching HomeAdvisor for the business name (cached between runs)"""
+        key = f"profile:{business_name.lower()}"
+        profile_url = self._cache_get(key)
+        if profile_url:
+            logger.info("  Using cached profile URL for: %s", business_name)
+            return profile_url
+        profile_url = self._search_profile_url(business_name)
+        self._cache_set(key, profile_url)
+        return profile_url
+    
+    def _search_profile_url(self, business_name):
         try:
             # Search HomeAdvisor for the business
             search_url = f"https://www.homeadvisor.com/search.html?query={business_name.replace(' ', '+')}"
             print(f"  Searching for profile URL: {search_url}")
+            self._limiter.acquire()
             self.driver.get(search_url)
             time.sleep(3)
             
@@ -1596,34 +2074,19 @@ class HomeAdvisorScraper:
             
             # Look for profile links in search results
             try:
-                profile_links = self.driver.find_elements(By.CSS_SELECTOR, 
-                    'a[href*="rated"], a[href*="/pro/"]')
-                for link in profile_links[:5]:  # Check first 5 results
-                    href = link.get_attribute('href')
-                    link_text = link.text.lower()
-                    business_name_lower = business_name.lower()
+                # Read the first 5 results and their result-card text in a single round-trip
+                profile_links = self.driver.execute_script(_PROFILE_LINKS_SCRIPT) or []
+                business_name_lower = business_name.lower()
+                for link in profile_links:
+                    href = link.get('href')
                     
                     # Check if this link seems related to our business
                     if href and ('rated' in href or '/pro/' in href):
-                        # Check if the link text or nearby text contains the business name
-                        try:
-                            parent = link.find_element(By.XPATH, './ancestor::*[contains(@class, "result") or contains(@class, "listing") or contains(@class, "card")][1]')
-                            parent_text = parent.text.lower()
-                            if business_name_lower in parent_text:
-                                # Make sure it's a full URL
-                                if not href.startswith('http'):
-                                    if href.startswith('/'):
-                                        href = 'https://www.homeadvisor.com' + href
-                                    else:
-                                        href = 'https://www.homeadvisor.com/' + href
-                                return href
-                        except:
-                            # If we can't check parent, just return the first matching href
-                            if not href.startswith('http'):
-                                if href.startswith('/'):
-                                    href = 'https://www.homeadvisor.com' + href
-                                else:
-                                    href = 'https://www.homeadvisor.com/' + href
+                        # Check if the nearby result text contains the business name;
+                        # if there is no result container, just return the first matching href
+                        parent_text = link.get('parentText')
+                        if parent_text is None or business_name_lower in parent_text.lower():
+                            href = _absolute_url(href)
                             return href
             except:
                 pass
@@ -1633,7 +2096,35 @@ class HomeAdvisorScraper:
         return None
     
     def enrich_business_data(self, business_data):
-        """Enrich business data by visiting the profile page"""
+        """Enrich business data by visiting the profile page (cached between runs by profile URL)"""
+        profile_url = business_data.get('profile_url', '')
+        cached = self._cache_get(f"enrich:{profile_url}") if profile_url else None
+        # An entry without a phone is a partial result (e.g. a failed click), so enrich it again
+        if cached and cached.get('phone'):
+            logger.info("  Using cached profile data for: %s", business_data.get('business_name', ''))
+            business_data.update(cached)
+            return business_data
+        
+        # Borrow a browser from the pool so several businesses can be enriched at once
+        with self._borrow_driver():
+            business_data = self._enrich_business_data(business_data)
+        
+        # The profile URL may have been found by searching, so key on the final one.
+        # Only complete results are cached; a missing phone is retried next run
+        profile_url = business_data.get('profile_url', '')
+        if profile_url and business_data.get('phone'):
+            self._cache_set(f"enrich:{profile_url}",
+                            {field: business_data[field] for field in _ENRICHED_FIELDS if business_data.get(field)})
+        return business_data
+    
+    def enrich_businesses(self, businesses):
+        """Enrich several businesses in parallel, one pooled browser per worker"""
+        with ThreadPoolExecutor(max_workers=self.enrich_workers) as executor:
+            return list(executor.map(self.enrich_business_data, businesses))
+    
+    def _enrich_business_data(self, business_data):
+        # Page text is only reused within one business
+        self._local.last_page = None
         profile_url = business_data.get('profile_url', '')
         
         # If we don't have a profile URL, try to search for it
@@ -1653,6 +2144,7 @@ class HomeAdvisorScraper:
         # If we have a profile URL, visit it to get all the data
         if profile_url:
             try:
+                # The browser is the only way to reveal a hidden phone; it keeps what HTTP already found
                 profile_data = self.get_data_from_profile_page(profile_url)
                 
                 # Merge profile data into business data
@@ -1694,6 +2186,33 @@ class HomeAdvisorScraper:
         
         return business_data
     
+    def ensure_sheet_headers(self):
+        """Add the header row if the sheet doesn't have one; returns a status message.
+        
+        Only row 1 is read, so this stays fast however many rows the sheet has.
+        """
+        first_row = self.sheet.row_values(1)
+        if _is_header_row(first_row):
+            return "Sheet already has headers, continuing..."
+        if not first_row:
+            # Row 1 is empty, so write the headers straight into it
+            self.sheet.update('A1', [SHEET_HEADERS])
+            return "Sheet initialized with headers"
+        # Insert headers at the beginning
+        self.sheet.insert_row(SHEET_HEADERS, 1)
+        return "Added headers to sheet"
+    
+    def reserve_sheet_rows(self, total_pages, start_page=1):
+        """Grow the sheet once up front to fit every page, instead of a bit with each append"""
+        try:
+            used_rows = len(self.sheet.col_values(1))
+            needed_rows = used_rows + (total_pages - start_page + 1) * LISTINGS_PER_PAGE + 10
+            if needed_rows > self.sheet.row_count:
+                self.sheet.resize(rows=needed_rows)
+                print(f"Resized sheet to {needed_rows} rows")
+        except Exception as e:
+            print(f"  ⚠️  Warning: Could not resize sheet: {e}")
+    
     def get_existing_business_names(self):
         """Get all existing business names from the sheet to check for duplicates"""
         try:
@@ -1703,12 +2222,7 @@ class HomeAdvisorScraper:
                 return set()
             
             # Skip header row if it exists
-            start_row = 0
-            if all_values and len(all_values) > 0:
-                # Check if first row looks like headers
-                first_row = [str(v).lower().strip() for v in all_values[0]]
-                if 'business name' in first_row or 'businessname' in ''.join(first_row).lower():
-                    start_row = 1
+            start_row = 1 if _is_header_row(all_values[0]) else 0
             
             # Extract business names (first column)
             existing_names = set()
@@ -1755,60 +2269,105 @@ class HomeAdvisorScraper:
             print(f"  All {len(businesses)} business(es) already exist in sheet, skipping write")
             return
         
-        # Prepare data for writing
-        rows = []
-        for business in new_businesses:
-            row = [
-                business.get('business_name', ''),
-                business.get('star_rating', ''),
-                business.get('num_reviews', ''),
-                business.get('address', ''),
-                business.get('website', ''),
-                business.get('phone', ''),
-                business.get('email', '')
-            ]
-            rows.append(row)
+        # Prepare data for writing, one value per sheet column
+        rows = [[business.get(key, '') for key in SHEET_COLUMNS] for business in new_businesses]
         
         # Append to sheet with retry logic
         if rows:
-            max_retries = 3
-            retry_delay = 2
+            max_retries = SHEET_MAX_RETRIES
             
             for attempt in range(max_retries):
                 try:
-                    self.sheet.append_rows(rows)
+                    # Call values.append directly instead of going through the append_rows wrapper.
+                    # RAW stores the strings as-is (no date/number parsing of phone numbers), and
+                    # OVERWRITE fills the rows reserved by reserve_sheet_rows instead of inserting new ones.
+                    self.sheet.spreadsheet.values_append(
+                        absolute_range_name(self.sheet.title, 'A1'),
+                        params={'valueInputOption': 'RAW', 'insertDataOption': 'OVERWRITE'},
+                        body={'values': rows},
+                    )
                     if skipped_count > 0:
                         print(f"Wrote {len(rows)} new businesses to sheet (skipped {skipped_count} duplicate(s))")
                     else:
                         print(f"Wrote {len(rows)} businesses to sheet")
                     return  # Success, exit function
                 except Exception as e:
-                    if attempt < max_retries - 1:
+                    if attempt < max_retries - 1 and _is_retryable_sheet_error(e):
+                        retry_delay = _sheet_retry_delay(attempt, e)
                         print(f"  Error writing to sheet (attempt {attempt + 1}/{max_retries}): {e}")
-                        print(f"  Retrying in {retry_delay} seconds...")
+                        print(f"  Retrying in {retry_delay:.1f} seconds...")
                         time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
                     else:
-                        print(f"  ✗ Failed to write to sheet after {max_retries} attempts: {e}")
-                        print(f"  Data will be retried on next batch write")
+                        print(f"  ✗ Failed to write to sheet after {attempt + 1} attempt(s): {e}")
                         raise  # Re-raise on final attempt
     
+    def buffer_for_sheet(self, business):
+        """Queue a business for the sheet, flushing once the buffer is full"""
+        self._save_progress(business)
+        self._pending_businesses.append(business)
+        if len(self._pending_businesses) >= SHEET_FLUSH_THRESHOLD:
+            self.flush_to_sheet()
+    
+    def _save_progress(self, business):
+        """Record a business in the local SQLite copy"""
+        values = [business.get(key, '') for key in SHEET_COLUMNS]
+        values += [business.get('profile_url', ''), time.strftime('%Y-%m-%d %H:%M:%S')]
+        try:
+            with self._progress_lock, self._progress_db:
+                self._progress_db.execute(
+                    f"INSERT INTO businesses VALUES ({', '.join('?' * len(values))})", values)
+        except sqlite3.Error as e:
+            print(f"  ⚠️  Warning: Could not save business to {PROGRESS_DB}: {e}")
+    
+    def flush_to_sheet(self):
+        """Hand every buffered business to the background sheet writer (doesn't wait for the write)"""
+        if not self._pending_businesses:
+            return
+        self._write_queue.put(self._pending_businesses)
+        self._pending_businesses = []
+    
+    def wait_for_sheet_writes(self):
+        """Block until every batch handed to the sheet writer has been written or has failed"""
+        self._write_queue.join()
+    
+    def _sheet_writer_loop(self):
+        while True:
+            batch = self._write_queue.get()
+            try:
+                if batch is None:
+                    return
+                # Businesses from a failed write go out again with the next batch
+                batch = self._unwritten_businesses + batch
+                self._unwritten_businesses = []
+                try:
+                    self.write_to_sheet(batch)
+                except Exception as e:
+                    self._unwritten_businesses = batch
+                    print(f"  ⚠️  Warning: Could not write {len(batch)} businesses to sheet: {e}")
+                    print(f"  They are saved in {PROGRESS_DB} and will be retried with the next batch")
+            finally:
+                self._write_queue.task_done()
+    
     def scrape_all_pages(self, total_pages=105, start_page=1):
         """Scrape all pages and collect data"""
-        all_businesses = []
-        empty_pages_count = 0
-        last_processed_page = start_page - 1  # Track the last successfully processed page
+        self.reserve_sheet_rows(total_pages, start_page)
+        try:
+            return self._scrape_all_pages(total_pages, start_page)
+        finally:
+            # Don't lose businesses still waiting in the buffer if scraping stops early
+            self.flush_to_sheet()
+            self.wait_for_sheet_writes()
+    
+    def _scrape_page_in_browser(self, page_num, try_http=True):
+        """Scrape a listing page with a pooled browser, retrying once if nothing is found.
         
-        for page_num in range(start_page, total_pages + 1):
-            print(f"\n{'='*50}")
-            print(f"Processing page {page_num} of {total_pages}")
-            print(f"{'='*50}")
-            
-            # Retry logic for pages that might fail
-            listings = None
+        try_http=False skips the plain HTTP attempt on both tries (the prefetch already failed).
+        """
+        listings = None
+        with self._borrow_driver():
             for retry in range(2):  # Try up to 2 times
                 try:
-                    listings = self.scrape_listings_from_page(page_num)
+                    listings = self.scrape_listings_from_page(page_num, try_http)
                     if listings:
                         break  # Success, exit retry loop
                     elif retry == 0:
@@ -1818,86 +2377,144 @@ class HomeAdvisorScraper:
                     print(f"  Error scraping page {page_num} (attempt {retry + 1}): {e}")
                     if retry < 1:
                         time.sleep(5)  # Wait before retry
+        return listings
+    
+    async def _scrape_pipeline(self, total_pages, start_page):
+        """Fetch listing pages and enrich businesses at the same time.
+        
+        One task walks the pages in order and queues their businesses, enrichment
+        workers drain that queue, and a writer task collects the results, so the
+        next page is fetched while the current one is still being enriched.
+        """
+        loop = asyncio.get_running_loop()
+        # Threads for the blocking work: one per enrichment browser, the browser page fallback and sheet writes
+        blocking = ThreadPoolExecutor(max_workers=self.enrich_workers + 2)
+        # One HTTP client for every listing page fetch of the run, so connections are reused
+        http_client = self._async_client() if FAST_HTTP_AVAILABLE else None
+        self._shared_async_client = http_client
+        self._shared_async_loop = loop
+        business_queue = asyncio.Queue(maxsize=self.enrich_workers * 2)
+        enriched_queue = asyncio.Queue()
+        all_businesses = []
+        progress = {'empty_pages': 0, 'last_page': start_page - 1}
+        
+        async def page_producer():
+            prefetched = {}
+            seen_profile_urls = set()  # Listing pages overlap, so skip profiles already enriched this run
             
-            if not listings:
-                empty_pages_count += 1
-                print(f"⚠️  No listings found on page {page_num} - skipping and continuing...")
-                print(f"   Total empty pages so far: {empty_pages_count}")
-                print(f"   Continuing to next page...")
-                time.sleep(3)  # Brief pause before next page
-                continue
-            
-            # Check if all businesses on this page have no profile URLs
-            businesses_without_profile = 0
-            for business in listings:
-                profile_url = business.get('profile_url', '')
-                if not profile_url:
-                    businesses_without_profile += 1
-            
-            # If all businesses have no profile URLs, stop scraping
-            if businesses_without_profile == len(listings) and len(listings) > 0:
-                last_processed_page = page_num
-                print(f"\n{'='*50}")
-                print(f"⚠️  STOPPING: All {len(listings)} businesses on page {page_num} have no profile URLs")
-                print(f"   Without profile URLs, we cannot get detailed information")
-                print(f"   (address, website, phone, email)")
-                print(f"   Stopping scraping process...")
-                print(f"{'='*50}\n")
+            for page_num in range(start_page, total_pages + 1):
+                logger.info("\n%s\nProcessing page %d of %d\n%s", '=' * 50, page_num, total_pages, '=' * 50)
                 
-                # Write any remaining businesses before stopping
-                if all_businesses:
-                    try:
-                        self.write_to_sheet(all_businesses)
-                        print(f"✓ Saved {len(all_businesses)} businesses to sheet before stopping")
-                    except Exception as e:
-                        print(f"⚠️  Warning: Could not write final batch to sheet: {e}")
+                # Fetch the next few listing pages concurrently over HTTP; the browser
+                # only has to load the pages that come back blocked or empty
+                if page_num not in prefetched:
+                    window_end = min(page_num + LISTING_PREFETCH_WINDOW, total_pages + 1)
+                    prefetched.update(await self._prefetch_listing_pages(range(page_num, window_end), http_client))
+                
+                listings = prefetched.get(page_num)
+                if listings:
+                    logger.info("Found %d listings on page %d over HTTP", len(listings), page_num)
+                else:
+                    # A page the prefetch already got nothing from over HTTP goes straight to the browser
+                    listings = await loop.run_in_executor(
+                        blocking, self._scrape_page_in_browser, page_num, page_num not in prefetched)
+                
+                if not listings:
+                    progress['empty_pages'] += 1
+                    print(f"⚠️  No listings found on page {page_num} - skipping and continuing...")
+                    print(f"   Total empty pages so far: {progress['empty_pages']}")
+                    print(f"   Continuing to next page...")
+                    continue
+                
+                # If all businesses have no profile URLs, stop scraping (stops looking at the first URL)
+                if all(not business.get('profile_url') for business in listings):
+                    progress['last_page'] = page_num
+                    print(f"\n{'='*50}")
+                    print(f"⚠️  STOPPING: All {len(listings)} businesses on page {page_num} have no profile URLs")
+                    print(f"   Without profile URLs, we cannot get detailed information")
+                    print(f"   (address, website, phone, email)")
+                    print(f"   Stopping scraping process...")
+                    print(f"{'='*50}\n")
+                    return  # Businesses already queued are still enriched and written
+                
+                # Update last processed page
+                progress['last_page'] = page_num
+                
+                # Skip businesses whose profile was already enriched on an earlier page
+                new_listings = []
+                for business in listings:
+                    profile_url = business.get('profile_url', '')
+                    if profile_url in seen_profile_urls:
+                        continue
+                    if profile_url:
+                        seen_profile_urls.add(profile_url)
+                    new_listings.append(business)
+                if len(new_listings) < len(listings):
+                    logger.info("  Skipping %d business(es) already seen on earlier pages",
+                                len(listings) - len(new_listings))
                 
-                break  # Exit the loop and stop scraping
-            
-            # Update last processed page
-            last_processed_page = page_num
-            
-            # Enrich each business with phone and email
-            for i, business in enumerate(listings, 1):
-                business_name = business.get('business_name', 'Unknown')
-                rating = business.get('star_rating', 'N/A')
-                reviews = business.get('num_reviews', 'N/A')
-                print(f"\nProcessing business {i}/{len(listings)}: {business_name}")
-                print(f"  Rating: {rating}, Reviews: {reviews}")
+                # Hand the businesses to the enrichment workers; this only waits when they fall behind
+                for business in new_listings:
+                    await business_queue.put(business)
+        
+        async def enricher():
+            # Each worker enriches with its own pooled browser; the shared rate limiter paces their requests
+            while True:
+                business = await business_queue.get()
+                if business is None:
+                    return
                 try:
-                    enriched = self.enrich_business_data(business)
-                    all_businesses.append(enriched)
+                    enriched = await loop.run_in_executor(blocking, self.enrich_business_data, business)
                 except Exception as e:
                     print(f"  Error enriching business data: {e}")
                     # Still add the business even if enrichment failed
-                    all_businesses.append(business)
-                
-                # Write to sheet periodically (every 10 businesses)
-                if len(all_businesses) % 10 == 0:
-                    try:
-                        self.write_to_sheet(all_businesses[-10:])
-                    except Exception as e:
-                        print(f"  Warning: Could not write to sheet: {e}")
-                        print(f"  Will retry on next batch or at the end")
+                    enriched = business
+                await enriched_queue.put(enriched)
+        
+        async def writer():
+            while True:
+                business = await enriched_queue.get()
+                if business is None:
+                    return
+                all_businesses.append(business)
+                logger.info("\nProcessed business %d: %s\n  Rating: %s, Reviews: %s", len(all_businesses),
+                            business.get('business_name', 'Unknown'),
+                            business.get('star_rating', 'N/A'), business.get('num_reviews', 'N/A'))
                 
-                # Random rate limiting to appear more human-like (2-5 seconds)
-                time.sleep(random.uniform(2, 5))
-            
-            # Write remaining businesses
-            if len(all_businesses) % 10 != 0:
-                remaining = all_businesses[-(len(all_businesses) % 10):]
-                self.write_to_sheet(remaining)
-            
-            # Random rate limiting between pages (3-8 seconds)
-            time.sleep(random.uniform(3, 8))
+                # Buffer for the sheet; rows are written in large batches instead of every 10 businesses
+                await loop.run_in_executor(blocking, self.buffer_for_sheet, business)
         
-        # Final write of any remaining businesses
-        if all_businesses:
-            try:
-                self.write_to_sheet(all_businesses)
-            except Exception as e:
-                print(f"\n⚠️  Warning: Could not write final batch to sheet: {e}")
-                print(f"  You may need to manually export the data or check your connection")
+        enrichers = [asyncio.create_task(enricher()) for _ in range(self.enrich_workers)]
+        writer_task = asyncio.create_task(writer())
+        try:
+            await page_producer()
+            for _ in enrichers:
+                await business_queue.put(None)
+            await asyncio.gather(*enrichers)
+            await enriched_queue.put(None)
+            await writer_task
+        finally:
+            for task in enrichers + [writer_task]:
+                task.cancel()
+            # Let running enrichment jobs finish (and drop queued ones) before close() quits their drivers
+            blocking.shutdown(wait=True, cancel_futures=True)
+            self._shared_async_client = None
+            self._shared_async_loop = None
+            if http_client is not None:
+                await http_client.aclose()
+        return all_businesses, progress
+    
+    def _scrape_all_pages(self, total_pages, start_page):
+        all_businesses, progress = asyncio.run(self._scrape_pipeline(total_pages, start_page))
+        empty_pages_count = progress['empty_pages']
+        last_processed_page = progress['last_page']
+        
+        # Final write of any buffered businesses
+        self.flush_to_sheet()
+        self.wait_for_sheet_writes()
+        if self._unwritten_businesses:
+            print(f"\n⚠️  Warning: {len(self._unwritten_businesses)} businesses could not be written to the sheet")
+            print(f"  They are saved in {PROGRESS_DB}; check your connection and export them from there")
         
         # Summary
         pages_processed = last_processed_page - start_page + 1
@@ -1913,18 +2530,36 @@ class HomeAdvisorScraper:
         return all_businesses
     
     def close(self):
-        """Close the Selenium driver"""
-        if self.driver:
-            self.driver.quit()
+        """Close the Selenium drivers, the HTTP clients, the lookup cache and the sheet writer"""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except:
+                pass
+        self._drivers = []
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        if self.captcha_solver is not None:
+            self.captcha_solver.close()
+        if self._query_cache is not None:
+            self._query_cache.close()
+        if self._sheet_writer.is_alive():
+            self._write_queue.put(None)
+            self._sheet_writer.join(timeout=30)
+        with self._progress_lock:
+            self._progress_db.close()
 
 
 def main():
-    import sys
-    
     # Configuration
     GOOGLE_SHEET_ID = "1b8JUs4vGZXY7YTnmPJ9KEUqDzXufmRuRBL2u5i6NPx4"  # Your Google Sheet ID
     CREDENTIALS_FILE = "homeadvisorelizabethscraping-613984138d99.json"  # Google Service Account credentials
     HEADLESS_MODE = True  # Set to False if you want to see the browser (useful for solving CAPTCHAs)
+    ENRICH_WORKERS = 1  # Number of browsers used to visit profile pages in parallel
+    LOG_LEVEL = logging.INFO  # Set to logging.WARNING to hide per-page and per-business progress
+    
+    logging.basicConfig(level=LOG_LEVEL, format='%(message)s', stream=sys.stdout)
     
     # Get URL from command line argument or prompt
     if len(sys.argv) > 1:
@@ -1979,7 +2614,7 @@ def main():
     print(f"  Starting from page: {START_PAGE}")
     print(f"{'='*60}\n")
     
-    scraper = HomeAdvisorScraper(base_url, GOOGLE_SHEET_ID, CREDENTIALS_FILE, headless=HEADLESS_MODE, captcha_api_key=captcha_api_key)
+    scraper = HomeAdvisorScraper(base_url, GOOGLE_SHEET_ID, CREDENTIALS_FILE, headless=HEADLESS_MODE, captcha_api_key=captcha_api_key, enrich_workers=ENRICH_WORKERS)
     
     try:
         # Detect total pages automatically
@@ -1995,36 +2630,9 @@ def main():
         
         # Check if headers exist, add them if not
         try:
-            all_values = scraper.sheet.get_all_values()
-            headers_exist = False
-            if all_values and len(all_values) > 0:
-                first_row = [str(v).lower().strip() for v in all_values[0]]
-                if 'business name' in first_row or 'businessname' in ''.join(first_row).lower():
-                    headers_exist = True
-            
-            if not headers_exist:
-                headers = ['business name', 'star rating', '# of reviews', 'address', 'website', 'Phone Number', 'Email']
-                # Only add headers if sheet is empty or doesn't have headers
-                if not all_values or len(all_values) == 0:
-                    scraper.sheet.append_row(headers)
-                    print("Sheet initialized with headers")
-                else:
-                    # Insert headers at the beginning
-                    scraper.sheet.insert_row(headers, 1)
-                    print("Added headers to sheet")
-            else:
-                print("Sheet already has headers, continuing...")
+            print(scraper.ensure_sheet_headers())
         except Exception as e:
             print(f"⚠️  Warning: Could not check/add headers: {e}")
-            # Try to add headers anyway if sheet is empty
-            try:
-                all_values = scraper.sheet.get_all_values()
-                if not all_values or len(all_values) == 0:
-                    headers = ['business name', 'star rating', '# of reviews', 'address', 'website', 'Phone Number', 'Email']
-                    scraper.sheet.append_row(headers)
-                    print("Sheet initialized with headers")
-            except:
-                pass
         
         # Scrape all pages
         businesses = scraper.scrape_all_pages(total_pages=TOTAL_PAGES, start_page=START_PAGE)
@@ -2039,7 +2647,6 @@ def main():
         print(f"  python scraper.py \"{base_url}\" {START_PAGE}")
     except Exception as e:
         print(f"Error in main: {e}")
-        import traceback
         traceback.print_exc()
     finally:
         scraper.close()
@@ -1,16 +1,77 @@
 import sys
 import os
 import io
+import logging
+import threading
 from contextlib import redirect_stdout
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-                             QTextEdit, QSpinBox, QGroupBox, QMessageBox, QProgressBar, QCheckBox)
+                             QPlainTextEdit, QSpinBox, QGroupBox, QMessageBox, QProgressBar, QCheckBox,
+                             QComboBox)
 from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTextStream
 from PyQt5.QtGui import QFont
 import traceback
 
 # Import the scraper
-from scraper import HomeAdvisorScraper
+from scraper import HomeAdvisorScraper, logger as scraper_logger
+
+# Choices for the log level drop-down
+LOG_LEVELS = [
+    ("Info (every page and business)", logging.INFO),
+    ("Warnings only (faster on long runs)", logging.WARNING),
+    ("Debug", logging.DEBUG),
+]
+
+
+class SignalEmitter:
+    """Collects printed lines and emits them as one signal every 50 ms instead of one per line"""
+    
+    def __init__(self, signal, interval=0.05):
+        self.signal = signal
+        self.interval = interval
+        self.lines = []
+        self.lock = threading.Lock()
+        self.timer = None
+    
+    def write(self, text):
+        if text.strip():  # Only emit non-empty lines
+            with self.lock:
+                self.lines.extend(line for line in text.rstrip().split('\n') if line.strip())
+                # Prints come from several worker threads, so use a plain timer rather than a QTimer
+                if self.timer is None:
+                    self.timer = threading.Timer(self.interval, self.flush)
+                    self.timer.daemon = True
+                    self.timer.start()
+        return len(text)
+    
+    def flush(self):
+        # Flushes run on the timer thread and the caller's; emitting under the
+        # lock keeps batches in order
+        with self.lock:
+            lines, self.lines = self.lines, []
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if lines:
+                self.signal.emit('\n'.join(lines))
+    
+    def isatty(self):
+        return False
+
+
+class QtLogHandler(logging.Handler):
+    """Logging handler that hands formatted records to the same batching emitter as print output"""
+    
+    def __init__(self, emitter, level=logging.INFO):
+        super().__init__(level)
+        self.emitter = emitter
+        self.setFormatter(logging.Formatter('%(message)s'))
+    
+    def emit(self, record):
+        try:
+            self.emitter.write(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
 
 
 class ScraperThread(QThread):
@@ -19,7 +80,8 @@ class ScraperThread(QThread):
     error_signal = pyqtSignal(str)  # For error messages
     finished_signal = pyqtSignal(int)  # For completion (number of businesses)
     
-    def __init__(self, base_url, start_page, google_sheet_id, credentials_file, headless=True, captcha_api_key=None):
+    def __init__(self, base_url, start_page, google_sheet_id, credentials_file, headless=True, captcha_api_key=None,
+                 log_level=logging.INFO):
         super().__init__()
         self.base_url = base_url
         self.start_page = start_page
@@ -27,11 +89,20 @@ class ScraperThread(QThread):
         self.credentials_file = credentials_file
         self.headless = headless
         self.captcha_api_key = captcha_api_key
+        self.log_level = log_level
         self.scraper = None
         self._is_running = True
     
     def run(self):
         """Run the scraper in this thread"""
+        # Log records and print output share one batching emitter, so they reach the GUI in order.
+        # Progress messages below the chosen level are dropped before they are even formatted
+        emitter = SignalEmitter(self.progress_signal)
+        log_handler = QtLogHandler(emitter, self.log_level)
+        scraper_logger.addHandler(log_handler)
+        # The logger is module-wide, so its level is put back once this run ends
+        old_log_level = scraper_logger.level
+        scraper_logger.setLevel(self.log_level)
         try:
             self.progress_signal.emit("Initializing scraper...")
             
@@ -49,6 +120,7 @@ class ScraperThread(QThread):
             
             self.progress_signal.emit("Detecting total number of pages...")
             total_pages = self.scraper.detect_total_pages()
+            emitter.flush()  # Logged lines go out before the direct messages below
             
             if total_pages == 0:
                 self.error_signal.emit("ERROR: Could not detect any pages. Please check the URL.")
@@ -57,61 +129,13 @@ class ScraperThread(QThread):
             self.progress_signal.emit(f"Found {total_pages} pages to scrape")
             self.progress_signal.emit(f"Starting from page {self.start_page}")
             
-            # Check if headers exist, add them if not
+            # Check if headers exist, add them if not (reads only the first row)
             try:
-                all_values = self.scraper.sheet.get_all_values()
-                headers_exist = False
-                if all_values and len(all_values) > 0:
-                    first_row = [str(v).lower().strip() for v in all_values[0]]
-                    if 'business name' in first_row or 'businessname' in ''.join(first_row).lower():
-                        headers_exist = True
-                
-                if not headers_exist:
-                    self.progress_signal.emit("Initializing Google Sheet with headers...")
-                    headers = ['business name', 'star rating', '# of reviews', 'address', 'website', 'Phone Number', 'Email']
-                    # Only add headers if sheet is empty or doesn't have headers
-                    if not all_values or len(all_values) == 0:
-                        self.scraper.sheet.append_row(headers)
-                        self.progress_signal.emit("Sheet initialized with headers")
-                    else:
-                        # Insert headers at the beginning
-                        self.scraper.sheet.insert_row(headers, 1)
-                        self.progress_signal.emit("Added headers to sheet")
-                else:
-                    self.progress_signal.emit("Sheet already has headers, continuing...")
+                self.progress_signal.emit(self.scraper.ensure_sheet_headers())
             except Exception as e:
                 self.progress_signal.emit(f"⚠️  Warning: Could not check/add headers: {e}")
-                # Try to add headers anyway if sheet is empty
-                try:
-                    all_values = self.scraper.sheet.get_all_values()
-                    if not all_values or len(all_values) == 0:
-                        headers = ['business name', 'star rating', '# of reviews', 'address', 'website', 'Phone Number', 'Email']
-                        self.scraper.sheet.append_row(headers)
-                        self.progress_signal.emit("Sheet initialized with headers")
-                except:
-                    pass
-            
-            # Create a custom stdout that emits signals
-            class SignalEmitter:
-                def __init__(self, signal):
-                    self.signal = signal
-                
-                def write(self, text):
-                    if text.strip():  # Only emit non-empty lines
-                        # Split by newlines and emit each line
-                        for line in text.rstrip().split('\n'):
-                            if line.strip():
-                                self.signal.emit(line)
-                    return len(text)
-                
-                def flush(self):
-                    pass
-                
-                def isatty(self):
-                    return False
             
             # Redirect stdout to capture print statements
-            emitter = SignalEmitter(self.progress_signal)
             old_stdout = sys.stdout
             sys.stdout = emitter
             
@@ -122,6 +146,7 @@ class ScraperThread(QThread):
                 
                 # Scrape all pages
                 businesses = self.scraper.scrape_all_pages(total_pages=total_pages, start_page=self.start_page)
+                emitter.flush()
                 
                 self.progress_signal.emit(f"\n{'='*50}")
                 self.progress_signal.emit(f"Scraping complete! Total businesses: {len(businesses)}")
@@ -131,11 +156,15 @@ class ScraperThread(QThread):
             finally:
                 # Restore stdout
                 sys.stdout = old_stdout
+                emitter.flush()
             
         except Exception as e:
             error_msg = f"Error: {str(e)}\n{traceback.format_exc()}"
             self.error_signal.emit(error_msg)
         finally:
+            scraper_logger.removeHandler(log_handler)
+            scraper_logger.setLevel(old_log_level)
+            emitter.flush()
             if self.scraper:
                 self.scraper.close()
     
@@ -209,6 +238,18 @@ class ScraperGUI(QMainWindow):
         headless_layout.addStretch()
         config_layout.addLayout(headless_layout)
         
+        # Log level
+        log_level_layout = QHBoxLayout()
+        log_level_label = QLabel("Log level:")
+        log_level_label.setMinimumWidth(150)
+        self.log_level_combo = QComboBox()
+        for label, level in LOG_LEVELS:
+            self.log_level_combo.addItem(label, level)
+        log_level_layout.addWidget(log_level_label)
+        log_level_layout.addWidget(self.log_level_combo)
+        log_level_layout.addStretch()
+        config_layout.addLayout(log_level_layout)
+        
         # CAPTCHA API Key input (optional)
         captcha_layout = QHBoxLayout()
         captcha_label = QLabel("2Captcha API Key:")
@@ -258,8 +299,12 @@ class ScraperGUI(QMainWindow):
         # Log output
         log_group = QGroupBox("Progress Log")
         log_layout = QVBoxLayout()
-        self.log_output = QTextEdit()
+        # QPlainTextEdit appends much faster than QTextEdit; old lines are dropped past the cap
+        # and no undo history is kept, so memory stays flat on long runs
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(2000)
+        self.log_output.setUndoRedoEnabled(False)
         self.log_output.setFont(QFont("Courier", 9))
         log_layout.addWidget(self.log_output)
         log_group.setLayout(log_layout)
@@ -269,13 +314,13 @@ class ScraperGUI(QMainWindow):
         self.statusBar().showMessage("Ready")
         
         # Add some default text
-        self.log_output.append("Welcome to HomeAdvisor Scraper!")
-        self.log_output.append("Enter a HomeAdvisor URL and click 'Start Scraping' to begin.")
-        self.log_output.append("")
+        self.log_output.appendPlainText("Welcome to HomeAdvisor Scraper!")
+        self.log_output.appendPlainText("Enter a HomeAdvisor URL and click 'Start Scraping' to begin.")
+        self.log_output.appendPlainText("")
     
     def log_message(self, message):
-        """Add a message to the log output"""
-        self.log_output.append(message)
+        """Add a message (one or more lines) to the log output"""
+        self.log_output.appendPlainText(message)
         # Auto-scroll to bottom
         self.log_output.verticalScrollBar().setValue(
             self.log_output.verticalScrollBar().maximum()
@@ -295,6 +340,7 @@ class ScraperGUI(QMainWindow):
         start_page = self.page_spinbox.value()
         headless = self.headless_checkbox.isChecked()
         captcha_api_key = self.captcha_input.text().strip() or None
+        log_level = self.log_level_combo.currentData()
         
         # Configuration
         GOOGLE_SHEET_ID = "1b8JUs4vGZXY7YTnmPJ9KEUqDzXufmRuRBL2u5i6NPx4"
@@ -320,7 +366,8 @@ class ScraperGUI(QMainWindow):
             GOOGLE_SHEET_ID, 
             CREDENTIALS_FILE, 
             headless=headless,
-            captcha_api_key=captcha_api_key
+            captcha_api_key=captcha_api_key,
+            log_level=log_level
         )
         self.scraper_thread.progress_signal.connect(self.log_message)
         self.scraper_thread.error_signal.connect(self.handle_error)
@@ -3,43 +3,56 @@ Test script to verify the scraper works on a single page
 Run this first to make sure everything is set up correctly
 """
 from scraper import HomeAdvisorScraper
+from itertools import islice
+import logging
 import os
+import sys
 
-def test_single_page():
-    """Test scraping a single page"""
+logger = logging.getLogger(__name__)
+
+def test_single_page(test_count=3, show_count=5):
+    """Test scraping a single page: fetch details for the first test_count listings
+    and list the names of up to show_count more"""
+    BASE_URL = "https://www.homeadvisor.com/c.Air-Conditioning.Elizabeth.NJ.-12002.html"  # Listing page to test
     GOOGLE_SHEET_ID = "1b8JUs4vGZXY7YTnmPJ9KEUqDzXufmRuRBL2u5i6NPx4"  # Your Google Sheet ID
     CREDENTIALS_FILE = "homeadvisorelizabethscraping-613984138d99.json"
     
     if not os.path.exists(CREDENTIALS_FILE):
-        print(f"ERROR: {CREDENTIALS_FILE} not found!")
-        print("Please create a Google Service Account and download the credentials JSON file.")
+        logger.error("ERROR: %s not found!\nPlease create a Google Service Account and download the credentials JSON file.",
+                     CREDENTIALS_FILE)
         return
     
-    scraper = HomeAdvisorScraper(GOOGLE_SHEET_ID, CREDENTIALS_FILE)
+    # Fast mode reads the listing page over plain HTTP when it can; Chrome is still
+    # started for the profile pages, since their phone numbers need a click to reveal
+    scraper = HomeAdvisorScraper(BASE_URL, GOOGLE_SHEET_ID, CREDENTIALS_FILE, fast_mode=True)
     
     try:
-        print("Testing scraper on page 1...")
-        listings = scraper.scrape_listings_from_page(1)
-        
-        print(f"\nFound {len(listings)} listings:")
+        logger.info("Testing scraper on page 1...")
+        listings_iter = scraper.iter_listings_from_page(1)
         
         # Test scraping address, website, and phone for first few listings
-        test_count = min(3, len(listings))  # Test first 3 listings
-        print(f"\nScraping detailed info (address, website, phone) for first {test_count} listings...")
+        test_listings = list(islice(listings_iter, test_count))
+        test_count = len(test_listings)
+        logger.info("\nScraping detailed info (address, website, phone) for first %d listings...", test_count)
         
-        for i, listing in enumerate(listings[:test_count], 1):
-            print(f"\n{i}. {listing.get('business_name', 'N/A')}")
-            print(f"   Rating: {listing.get('star_rating', 'N/A')}")
-            print(f"   Reviews: {listing.get('num_reviews', 'N/A')}")
+        # Fetch all the profile pages at once instead of one after another
+        profile_urls = [listing['profile_url'] for listing in test_listings if listing.get('profile_url')]
+        logger.info("Fetching address, website, and phone for %d profiles...", len(profile_urls))
+        profiles = scraper.fetch_profile_data(profile_urls)
+        
+        for i, listing in enumerate(test_listings, 1):
+            # Each listing is logged as one message rather than a line at a time
+            lines = [
+                f"\n{i}. {listing.get('business_name', 'N/A')}",
+                f"   Rating: {listing.get('star_rating', 'N/A')}",
+                f"   Reviews: {listing.get('num_reviews', 'N/A')}",
+            ]
             
             # Get profile URL
             profile_url = listing.get('profile_url')
             if profile_url:
-                print(f"   Profile URL: {profile_url}")
-                print(f"   Fetching address, website, and phone...")
-                
-                # Visit profile page to get address, website, and phone
-                profile_data = scraper.get_data_from_profile_page(profile_url)
+                lines.append(f"   Profile URL: {profile_url}")
+                profile_data = profiles.get(profile_url) or {}
                 
                 # Merge profile data with listing data
                 if profile_data.get('address'):
@@ -49,39 +62,42 @@ def test_single_page():
                 if profile_data.get('phone'):
                     listing['phone'] = profile_data['phone']
                 
-                print(f"   ✓ Address: {listing.get('address', 'N/A')}")
-                print(f"   ✓ Website: {listing.get('website', 'N/A')}")
-                print(f"   ✓ Phone: {listing.get('phone', 'N/A')}")
+                lines.append(f"   ✓ Address: {listing.get('address', 'N/A')}")
+                lines.append(f"   ✓ Website: {listing.get('website', 'N/A')}")
+                lines.append(f"   ✓ Phone: {listing.get('phone', 'N/A')}")
             else:
-                print(f"   ⚠️  No profile URL found")
+                lines.append("   ⚠️  No profile URL found")
+            logger.info("\n".join(lines))
         
-        # Show remaining listings without detailed scraping
-        if len(listings) > test_count:
-            print(f"\n... and {len(listings) - test_count} more listings (detailed info not fetched)")
+        # Show a few more listings by name, and count the rest, without detailed scraping
+        shown = list(islice(listings_iter, show_count))
+        if shown:
+            logger.info("\n".join(f"{i}. {listing.get('business_name', 'N/A')}"
+                                   for i, listing in enumerate(shown, test_count + 1)))
+        total_count = test_count + len(shown) + sum(1 for _ in listings_iter)
+        if total_count > test_count:
+            logger.info("\n... and %d more listings (detailed info not fetched)", total_count - test_count)
         
-        if listings:
-            print(f"\n✓ Scraper is working! Found {len(listings)} listings on page 1.")
-            print("\nTesting Google Sheet write...")
+        if total_count:
+            logger.info("\n✓ Scraper is working! Found %d listings on page 1.\n\nTesting Google Sheet write...",
+                        total_count)
             
-            # Write first listing to sheet as a test
-            if listings:
-                test_business = listings[0]
-                scraper.write_to_sheet([test_business])
-                print(f"✓ Wrote test listing '{test_business.get('business_name', 'Unknown')}' to your Google Sheet")
-                print("  Check your sheet to verify it appeared!")
+            # Write the listings tested above to the sheet in one batched call
+            scraper.write_to_sheet(test_listings)
+            logger.info("✓ Wrote %d test listing(s) to your Google Sheet\n  Check your sheet to verify they appeared!",
+                        test_count)
             
-            print("\nYou can now run the full scraper with: python scraper.py")
+            logger.info("\nYou can now run the full scraper with: python scraper.py")
         else:
-            print("\n✗ No listings found. The page structure may have changed.")
-            print("You may need to update the selectors in scraper.py")
+            logger.warning("\n✗ No listings found. The page structure may have changed.\n"
+                           "You may need to update the selectors in scraper.py")
             
-    except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error testing the scraper")
     finally:
         scraper.close()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     test_single_page()
 